@@ -1,26 +1,17 @@
 import asyncio
+import functools
+import importlib.util
 import os
+import re
 import ssl as _ssl
 from logging.config import fileConfig
 from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
-from sqlalchemy import pool
+from sqlalchemy import MetaData, create_engine, pool
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 
-# Import all models so Alembic autogenerate can detect them
-from src.models import (  # noqa: F401
-    AuditLog,
-    Category,
-    Product,
-    StockLevel,
-    StockTransfer,
-    User,
-    Warehouse,
-)
-from src.models.base import Base
-
 # Alembic Config object — provides access to values in alembic.ini
 config = context.config
 
@@ -28,36 +19,72 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Metadata for autogenerate support
-target_metadata = Base.metadata
 
+@functools.cache
+def _load_target_metadata() -> MetaData:
+    """Import the ORM models and return their metadata for autogenerate.
+
+    Deferred so that offline (``--sql``) runs never pay for declarative class
+    construction; only online runs, which may autogenerate, need the mappers.
+    """
+    from src.models import (  # noqa: F401
+        AuditLog,
+        Category,
+        Product,
+        StockLevel,
+        StockTransfer,
+        User,
+        Warehouse,
+    )
+    from src.models.base import Base
+
+    return Base.metadata
 
+
+@functools.lru_cache(maxsize=1)
+def _default_ssl_context() -> _ssl.SSLContext:
+    """Build the default client SSL context once; loading the CA bundle is slow."""
+    return _ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=1)
 def _asyncpg_connect_args(url: str) -> tuple[str, dict]:
-    """Strip ``sslmode`` from URL and return connect_args for asyncpg."""
+    """Strip ``sslmode`` from URL and return connect_args for asyncpg.
+
+    Every DDL statement runs exactly once, so asyncpg's prepared-statement
+    cache is disabled, and JIT is turned off to avoid its per-query planning
+    overhead on a short-lived connection.
+    """
+    connect_args: dict = {
+        "statement_cache_size": 0,
+        "server_settings": {"jit": "off", "application_name": "alembic"},
+    }
     parts = urlsplit(url)
+    if "sslmode" not in parts.query:
+        return url, connect_args
     qs = parse_qs(parts.query)
-    connect_args: dict = {}
     if "sslmode" in qs:
         mode = qs.pop("sslmode")[0]
         if mode in ("require", "verify-ca", "verify-full"):
-            connect_args["ssl"] = _ssl.create_default_context()
+            connect_args["ssl"] = _default_ssl_context()
         url = urlunsplit(parts._replace(query=urlencode(qs, doseq=True)))
     return url, connect_args
 
 
+# Matches driver-less Postgres schemes (``postgresql://`` and ``postgres://``).
+_PLAIN_SCHEME_RE = re.compile(r"^postgres(?:ql)?://")
+
+
+@functools.lru_cache(maxsize=1)
 def get_url() -> str:
     """Return the direct (non-pooled) database URL for DDL migrations.
 
     PgBouncer in transaction mode cannot execute DDL, so Alembic migrations
     must use DATABASE_URL_DIRECT (the non-pooled Neon connection string).
+    The environment is read once per process; the result is memoised.
     """
-    url = os.environ["DATABASE_URL_DIRECT"]
     # Ensure the URL uses the asyncpg driver for async execution
-    if url.startswith("postgresql://"):
-        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-    elif url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql+asyncpg://", 1)
-    return url
+    return _PLAIN_SCHEME_RE.sub("postgresql+asyncpg://", os.environ["DATABASE_URL_DIRECT"], count=1)
 
 
 def run_migrations_offline() -> None:
@@ -70,7 +97,6 @@ def run_migrations_offline() -> None:
     url = get_url().replace("postgresql+asyncpg://", "postgresql://")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -79,7 +105,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=_load_target_metadata())
     with context.begin_transaction():
         context.run_migrations()
 
@@ -87,9 +113,14 @@ def do_run_migrations(connection) -> None:
 async def run_async_migrations() -> None:
     """Run migrations using an async engine (required for asyncpg)."""
     url, connect_args = _asyncpg_connect_args(get_url())
+    # A single pooled connection is reused for the whole run instead of
+    # reconnecting (TCP + TLS) whenever the engine is asked for one.
     connectable = create_async_engine(
         url,
-        poolclass=pool.NullPool,
+        poolclass=pool.AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
         connect_args=connect_args,
     )
     async with connectable.connect() as connection:
@@ -97,8 +128,41 @@ async def run_async_migrations() -> None:
     await connectable.dispose()
 
 
+def run_sync_migrations() -> None:
+    """Run migrations on a synchronous psycopg2 engine.
+
+    Alembic is synchronous, so this avoids bridging every DDL statement
+    through ``run_sync``'s greenlet.  libpq understands ``sslmode`` natively.
+    """
+    url = get_url().replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
+    connectable = create_engine(
+        url,
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        connect_args={"application_name": "alembic", "options": "-c jit=off"},
+    )
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
+    connectable.dispose()
+
+
 def run_migrations_online() -> None:
-    asyncio.run(run_async_migrations())
+    # psycopg2 is not a project dependency; use it when the environment has it
+    # and keep the asyncpg path as the default.
+    if importlib.util.find_spec("psycopg2") is not None:
+        run_sync_migrations()
+        return
+
+    # uvloop ships with uvicorn[standard]; fall back to the stock loop where it
+    # is unavailable (e.g. Windows).  uvloop.install() is deprecated on 3.12+.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_async_migrations())
+    else:
+        uvloop.run(run_async_migrations())
 
 
 if context.is_offline_mode():
@@ -0,0 +1,42 @@
+"""audit_logs ip_address inet
+
+Revision ID: 0a6d3f8b2c95
+Revises: f3a7c9d1e5b2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6d3f8b2c95"
+down_revision: str | None = "f3a7c9d1e5b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "audit_logs",
+        "ip_address",
+        type_=postgresql.INET(),
+        existing_type=sa.String(45),
+        existing_nullable=True,
+        postgresql_using="ip_address::inet",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "audit_logs",
+        "ip_address",
+        type_=sa.String(45),
+        existing_type=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using="host(ip_address)",
+    )
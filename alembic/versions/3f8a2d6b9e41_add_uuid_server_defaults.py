@@ -0,0 +1,63 @@
+"""add uuid server defaults
+
+Revision ID: 3f8a2d6b9e41
+Revises: 7c1e9a04d2b3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a2d6b9e41"
+down_revision: str | None = "7c1e9a04d2b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Low-volume tables keep random v4 ids; append-heavy tables get time-ordered
+# v7 ids so inserts hit the rightmost leaf of the primary-key index.
+_V4_TABLES = ("users", "categories", "warehouses", "products")
+_V7_TABLES = ("stock_levels", "stock_transfers", "audit_logs")
+
+# RFC 9562 UUIDv7: overwrite the first 48 bits of a random v4 UUID with the
+# Unix time in milliseconds, then flip the version nibble from 4 to 7.
+_CREATE_UUID_V7 = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+LANGUAGE sql VOLATILE PARALLEL SAFE AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute(_CREATE_UUID_V7)
+    for table in _V4_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    for table in _V7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    for table in _V7_TABLES + _V4_TABLES:
+        op.alter_column(table, "id", server_default=None)
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,42 @@
+"""users email citext
+
+Revision ID: 5d0b7e3c1a92
+Revises: 3f8a2d6b9e41
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d0b7e3c1a92"
+down_revision: str | None = "3f8a2d6b9e41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # citext is a trusted extension (PG13+), so the database owner can create it.
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.alter_column(
+        "users",
+        "email",
+        type_=postgresql.CITEXT(),
+        existing_type=sa.String(255),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "users",
+        "email",
+        type_=sa.String(255),
+        existing_type=postgresql.CITEXT(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,32 @@
+"""audit_logs changes gin index
+
+Revision ID: 6b2e8d4f1a73
+Revises: 0a6d3f8b2c95
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b2e8d4f1a73"
+down_revision: str | None = "0a6d3f8b2c95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports containment (@>), which is the audit diff
+    # query shape, and is markedly smaller than the default jsonb_ops.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_changes "
+            "ON audit_logs USING gin (changes jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_changes")
@@ -0,0 +1,42 @@
+"""add foreign key indexes
+
+Revision ID: 7c1e9a04d2b3
+Revises: 1a2b3c4d5e6f
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e9a04d2b3"
+down_revision: str | None = "1a2b3c4d5e6f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Postgres does not index the referencing side of a foreign key. Joins on
+# these columns and parent deletes would otherwise scan the child table.
+# stock_levels.product_id is omitted: it leads the uq_stock_levels_product_warehouse
+# index, which already serves lookups by product.
+_FK_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("categories", "parent_id"),
+    ("products", "category_id"),
+    ("stock_levels", "warehouse_id"),
+    ("stock_transfers", "product_id"),
+    ("stock_transfers", "from_warehouse_id"),
+    ("stock_transfers", "to_warehouse_id"),
+    ("stock_transfers", "initiated_by"),
+    ("audit_logs", "user_id"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _FK_COLUMNS:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def downgrade() -> None:
+    for table, column in reversed(_FK_COLUMNS):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
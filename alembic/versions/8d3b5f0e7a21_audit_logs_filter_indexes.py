@@ -0,0 +1,45 @@
+"""audit_logs filter indexes
+
+Revision ID: 8d3b5f0e7a21
+Revises: 6b2e8d4f1a73
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3b5f0e7a21"
+down_revision: str | None = "6b2e8d4f1a73"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The audit endpoint filters by equality on user / action / resource type
+    # and pages newest-first by created_at.  A backward scan of an ascending
+    # created_at key serves the DESC ordering, so no DESC key is needed.
+    # The user index leads with user_id, which supersedes the plain FK index.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_user_id_created_at "
+            "ON audit_logs (user_id, created_at) INCLUDE (action, resource_type)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_action_resource_type_created_at "
+            "ON audit_logs (action, resource_type, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_user_id ON audit_logs (user_id)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_action_resource_type_created_at"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_user_id_created_at")
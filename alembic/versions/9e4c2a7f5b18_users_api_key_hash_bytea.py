@@ -0,0 +1,44 @@
+"""users api_key_hash bytea
+
+Revision ID: 9e4c2a7f5b18
+Revises: 5d0b7e3c1a92
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4c2a7f5b18"
+down_revision: str | None = "5d0b7e3c1a92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The existing unique constraint is kept: Postgres hash indexes cannot be
+    # unique, and a B-tree over a fixed 32-byte bytea compares with memcmp.
+    op.alter_column(
+        "users",
+        "api_key_hash",
+        type_=postgresql.BYTEA(),
+        existing_type=sa.String(255),
+        existing_nullable=True,
+        postgresql_using="decode(api_key_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "users",
+        "api_key_hash",
+        type_=sa.String(255),
+        existing_type=postgresql.BYTEA(),
+        existing_nullable=True,
+        postgresql_using="encode(api_key_hash, 'hex')",
+    )
@@ -0,0 +1,33 @@
+"""tune products search_vector gin
+
+Revision ID: b2d6f1a8c347
+Revises: 9e4c2a7f5b18
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d6f1a8c347"
+down_revision: str | None = "9e4c2a7f5b18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Buffer new entries in an 8 MB pending list (default 4 MB) so bulk product
+    # inserts append there and posting lists are merged in batches by vacuum.
+    # IF EXISTS: on fresh databases the index is only built by e1f5b8c2a7d4.
+    op.execute(
+        "ALTER INDEX IF EXISTS ix_products_search_vector "
+        "SET (fastupdate = on, gin_pending_list_limit = 8192)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER INDEX IF EXISTS ix_products_search_vector RESET (fastupdate, gin_pending_list_limit)"
+    )
@@ -0,0 +1,63 @@
+"""products integer price and weight
+
+Revision ID: c4a9e2f7d615
+Revises: b2d6f1a8c347
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2f7d615"
+down_revision: str | None = "b2d6f1a8c347"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Numeric(10,2) and Numeric(8,3) convert exactly to cents and grams.
+    # ck_products_price_non_negative follows the column through the rename.
+    op.alter_column(
+        "products",
+        "price",
+        type_=sa.BigInteger(),
+        existing_type=sa.Numeric(10, 2),
+        existing_nullable=False,
+        postgresql_using="(price * 100)::bigint",
+    )
+    op.alter_column("products", "price", new_column_name="price_cents")
+    op.alter_column(
+        "products",
+        "weight_kg",
+        type_=sa.Integer(),
+        existing_type=sa.Numeric(8, 3),
+        existing_nullable=True,
+        postgresql_using="(weight_kg * 1000)::integer",
+    )
+    op.alter_column("products", "weight_kg", new_column_name="weight_grams")
+
+
+def downgrade() -> None:
+    op.alter_column("products", "weight_grams", new_column_name="weight_kg")
+    op.alter_column(
+        "products",
+        "weight_kg",
+        type_=sa.Numeric(8, 3),
+        existing_type=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="weight_kg / 1000.0",
+    )
+    op.alter_column("products", "price_cents", new_column_name="price")
+    op.alter_column(
+        "products",
+        "price",
+        type_=sa.Numeric(10, 2),
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+        postgresql_using="price / 100.0",
+    )
@@ -0,0 +1,34 @@
+"""products search_vector index concurrently
+
+Revision ID: e1f5b8c2a7d4
+Revises: c4a9e2f7d615
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f5b8c2a7d4"
+down_revision: str | None = "c4a9e2f7d615"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block, and it keeps product
+    # writes unblocked while the index builds on a populated table.  Databases
+    # created before this revision already have the index, hence IF NOT EXISTS.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_search_vector "
+            "ON products USING gin (search_vector tsvector_ops) "
+            "WITH (fastupdate = on, gin_pending_list_limit = 8192)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_search_vector")
@@ -1,19 +1,23 @@
 """Audit log endpoint — admin-only read access to the audit trail."""
 
-import math
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_db, require_admin
 from src.models import User
 from src.schemas.audit import AuditLogQuery, AuditLogResponse
 from src.schemas.common import PaginatedResponse, Pagination
-from src.services.audit import list_audit_logs
+from src.services.audit import encode_audit_cursor, list_audit_logs
 
 router = APIRouter(tags=["Audit"])
 
+# Built once at import; validating the whole page in one call reuses the
+# compiled validator instead of dispatching per row.
+_AUDIT_LOG_LIST = TypeAdapter(list[AuditLogResponse])
+
 
 @router.get("/audit-log", response_model=PaginatedResponse[AuditLogResponse])
 async def get_audit_log(
@@ -24,16 +28,20 @@ async def get_audit_log(
     """Return a paginated, filterable view of the audit log.
 
     Restricted to admin users.  Supports filtering by date range, action,
-    resource type, and the user who performed the action.
+    resource type, and the user who performed the action.  A full page carries
+    ``pagination.next_cursor``; pass it back as ``cursor`` to fetch the next
+    page by keyset instead of by offset.
     """
     logs, total = await list_audit_logs(db, q)
-    total_pages = math.ceil(total / q.per_page) if q.per_page > 0 else 0
+    next_cursor = encode_audit_cursor(logs[-1]) if logs and len(logs) == q.per_page else None
+    total_pages = (total + q.per_page - 1) // q.per_page if q.per_page > 0 else 0
     return PaginatedResponse[AuditLogResponse](
-        data=[AuditLogResponse.model_validate(log) for log in logs],
+        data=_AUDIT_LOG_LIST.validate_python(logs, from_attributes=True),
         pagination=Pagination(
             page=q.page,
             per_page=q.per_page,
             total=total,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
@@ -7,6 +7,7 @@ from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.config import settings
 from src.dependencies import get_current_user, get_db
@@ -27,8 +28,8 @@ from src.services.auth import (
     decode_token,
     generate_api_key,
     hash_api_key,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -73,7 +74,7 @@ async def register(
     user = User(
         email=body.email,
         name=body.name,
-        password_hash=hash_password(body.password),
+        password_hash=await hash_password_async(body.password),
         api_key_hash=hash_api_key(raw_api_key),
         api_key_prefix=raw_api_key[:8],
     )
@@ -119,10 +120,16 @@ async def login(
     (7-day lifetime) on success.
     Rate limited: 10 requests per minute per IP address.
     """
-    result = await db.execute(select(User).where(User.email == body.email))
+    # Only the columns needed to authenticate and mint tokens.
+    result = await db.execute(
+        select(User)
+        .where(User.email == body.email)
+        .options(load_only(User.email, User.role, User.password_hash, User.is_active))
+    )
     user: User | None = result.scalar_one_or_none()
 
-    if user is None or not verify_password(body.password, user.password_hash):
+    password_hash = user.password_hash if user is not None else None
+    if not await verify_password_async(body.password, password_hash) or user is None:
         raise _INVALID_CREDENTIALS
 
     if not user.is_active:
@@ -132,9 +139,10 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    subject = str(user.id)
     return TokenResponse(
-        access_token=create_access_token(str(user.id), user.email, user.role),
-        refresh_token=create_refresh_token(str(user.id)),
+        access_token=create_access_token(subject, user.email, user.role),
+        refresh_token=create_refresh_token(subject),
         expires_in=settings.access_token_expire_minutes * 60,
     )
 
@@ -169,12 +177,8 @@ async def refresh(
     if payload.get("type") != "refresh":
         raise _INVALID_REFRESH
 
-    raw_id: str | None = payload.get("sub")
-    if not raw_id:
-        raise _INVALID_REFRESH
-
     try:
-        user_id = uuid.UUID(raw_id)
+        user_id = uuid.UUID(payload["sub"])
     except ValueError:
         raise _INVALID_REFRESH from None
 
@@ -182,9 +186,10 @@ async def refresh(
     if user is None or not user.is_active:
         raise _INVALID_REFRESH
 
+    subject = str(user.id)
     return TokenResponse(
-        access_token=create_access_token(str(user.id), user.email, user.role),
-        refresh_token=create_refresh_token(str(user.id)),
+        access_token=create_access_token(subject, user.email, user.role),
+        refresh_token=create_refresh_token(subject),
         expires_in=settings.access_token_expire_minutes * 60,
     )
 
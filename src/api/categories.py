@@ -3,13 +3,14 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.dependencies import get_db, require_admin
+from src.middleware.client_ip import client_ip
 from src.models import Category, Product, User
 from src.schemas.category import (
     CategoryCreate,
@@ -20,6 +21,7 @@ from src.schemas.category import (
 from src.schemas.common import ErrorResponse, PaginatedResponse
 from src.services.audit import record_audit
 from src.utils.pagination import paginate
+from src.utils.responses import model_json_response
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
@@ -47,13 +49,14 @@ async def list_categories(
     page: int = Query(1, ge=1),  # noqa: B008
     per_page: int = Query(20, ge=1, le=100),  # noqa: B008
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> PaginatedResponse[CategoryResponse]:
+) -> Response:
     """Return categories as a paginated flat list ordered by name.
 
     Parent–child hierarchy is expressed via the ``parent_id`` field on each item.
     """
     query = select(Category).order_by(Category.name)
-    return await paginate(db, query, page, per_page, CategoryResponse)
+    listing = await paginate(db, query, page, per_page, CategoryResponse, estimate_total=True)
+    return model_json_response(listing)
 
 
 @router.post(
@@ -96,7 +99,7 @@ async def create_category(
             "description": body.description,
             "parent_id": str(body.parent_id) if body.parent_id else None,
         },
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
 
     try:
@@ -125,10 +128,7 @@ async def get_category(
     db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> CategoryDetailResponse:
     """Return a single category with its full list of associated products."""
-    result = await db.execute(
-        select(Category).where(Category.id == category_id).options(selectinload(Category.products))
-    )
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id, options=[selectinload(Category.products)])
     if category is None:
         raise _NOT_FOUND
     return CategoryDetailResponse.model_validate(category)
@@ -158,22 +158,21 @@ async def update_category(
     The audit log records only fields whose values actually changed.
     Returns 400 if ``parent_id`` references a non-existent category.
     """
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id)
     if category is None:
         raise _NOT_FOUND
 
     update_data = body.model_dump(exclude_unset=True)
-    changes: dict[str, dict[str, Any]] = {}
 
-    for field, new_value in update_data.items():
-        old_value = getattr(category, field)
-        if old_value != new_value:
-            changes[field] = {
-                "old": _serialize_value(old_value),
-                "new": _serialize_value(new_value),
-            }
-            setattr(category, field, new_value)
+    # Compare against the loaded column values directly; skips the descriptor per field
+    loaded = category.__dict__
+    changed = {field: value for field, value in update_data.items() if loaded[field] != value}
+    changes = {
+        field: {"old": _serialize_value(loaded[field]), "new": _serialize_value(value)}
+        for field, value in changed.items()
+    }
+    for field, value in changed.items():
+        setattr(category, field, value)
 
     if changes:
         await record_audit(
@@ -183,7 +182,7 @@ async def update_category(
             resource_type="category",
             resource_id=category_id,
             changes=changes,
-            ip_address=request.client.host if request.client else None,
+            ip_address=client_ip(request),
         )
         try:
             await db.commit()
@@ -219,17 +218,14 @@ async def delete_category(
     Returns 400 (INVALID_OPERATION) if the category has any products assigned to it,
     active or inactive — products must be re-assigned or deleted first.
     """
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    category = result.scalar_one_or_none()
+    category = await db.get(Category, category_id)
     if category is None:
         raise _NOT_FOUND
 
     # Cascade protection: block delete when products reference this category
-    count_result = await db.execute(
-        select(func.count()).select_from(Product).where(Product.category_id == category_id)
-    )
-    product_count: int = count_result.scalar_one()
-    if product_count > 0:
+    in_use_result = await db.execute(select(exists().where(Product.category_id == category_id)))
+    in_use: bool = in_use_result.scalar_one()
+    if in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete category: it still has products assigned to it",
@@ -242,7 +238,7 @@ async def delete_category(
         resource_type="category",
         resource_id=category_id,
         changes={"name": category.name},
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     await db.delete(category)
     await db.commit()
@@ -1,17 +1,23 @@
 """Product CRUD endpoints with full-text search, combined filters, and audit logging."""
 
+import base64
+import functools
 import uuid
+from collections.abc import Callable
+from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import ColumnElement, func, select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.dependencies import get_current_user, get_db, require_admin
-from src.models import Product, StockLevel, User
+from src.middleware.client_ip import client_ip
+from src.models import Category, Product, StockLevel, User
 from src.schemas.category import CategoryResponse
 from src.schemas.common import ErrorResponse, PaginatedResponse
 from src.schemas.product import (
@@ -19,12 +25,14 @@ from src.schemas.product import (
     ProductDetailResponse,
     ProductListParams,
     ProductResponse,
+    ProductSortField,
     ProductStockLevel,
     ProductUpdate,
     SortOrder,
 )
 from src.services.audit import record_audit
 from src.utils.pagination import paginate
+from src.utils.responses import model_json_response
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
@@ -33,6 +41,54 @@ _NOT_FOUND = HTTPException(
     detail="Product not found",
 )
 
+_INVALID_CATEGORY = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid category_id: referenced category does not exist",
+)
+
+#: Columns ``sort_by`` may name, resolved once instead of via ``getattr`` per request.
+_SORT_COLUMNS: dict[ProductSortField, InstrumentedAttribute[Any]] = {
+    "name": Product.name,
+    "price": Product.price,
+    "created_at": Product.created_at,
+    "sku": Product.sku,
+}
+
+#: Parse the sort value embedded in a product cursor, per ``sort_by`` column.
+_CURSOR_PARSERS: dict[str, Callable[[str], Any]] = {
+    "name": str,
+    "price": Decimal,
+    "created_at": datetime.fromisoformat,
+    "sku": str,
+}
+
+_INVALID_CURSOR = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid cursor",
+)
+
+
+def _encode_product_cursor(product: Product, sort_by: ProductSortField) -> str:
+    """Return an opaque keyset cursor pointing just past *product* in ``sort_by`` order."""
+    raw = f"{sort_by},{getattr(product, sort_by)},{product.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_product_cursor(cursor: str, sort_by: ProductSortField) -> tuple[Any, uuid.UUID]:
+    """Return the ``(sort value, id)`` key encoded in *cursor*.
+
+    Raises HTTP 400 if *cursor* is malformed or was issued for another ``sort_by``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        field, _, rest = raw.partition(",")
+        value, _, product_id = rest.rpartition(",")
+        if field != sort_by:
+            raise ValueError(field)
+        return _CURSOR_PARSERS[field](value), uuid.UUID(product_id)
+    except (ValueError, ArithmeticError):
+        raise _INVALID_CURSOR from None
+
 
 def _serialize_value(value: Any) -> Any:
     """Convert a field value to a JSON-safe type for audit log storage."""
@@ -53,27 +109,40 @@ def _serialize_value(value: Any) -> Any:
 async def list_products(
     params: ProductListParams = Depends(),  # noqa: B008
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> PaginatedResponse[ProductResponse]:
+) -> Response:
     """Return products as a paginated, filterable, searchable list.
 
     When ``search`` is provided, results are ranked by full-text relevance using
     ``ts_rank``.  Otherwise, results are sorted by ``sort_by`` / ``sort_order``.
     All filters (``category_id``, ``min_price``, ``max_price``, ``is_active``) are
-    optional and combinable.
+    optional and combinable.  A full page carries ``pagination.next_cursor``;
+    pass it back as ``cursor`` to fetch the next page by keyset instead of by
+    offset (not available with ``search``).
     """
     query = select(Product).options(selectinload(Product.category))
+    after: ColumnElement[bool] | None = None
+    cursor_for: Callable[[Product], str] | None = None
 
     # Full-text search — order by relevance when a search term is active
     if params.search:
+        if params.cursor is not None:
+            raise _INVALID_CURSOR
         tsquery = func.plainto_tsquery("english", params.search)
         query = query.where(Product.search_vector.op("@@")(tsquery))
         query = query.order_by(func.ts_rank(Product.search_vector, tsquery).desc())
     else:
-        sort_col = getattr(Product, params.sort_by)
+        sort_col = _SORT_COLUMNS[params.sort_by]
+        # Product.id breaks ties so the (sort_col, id) keyset order is total
+        key = tuple_(sort_col, Product.id)
         if params.sort_order == SortOrder.asc:
-            query = query.order_by(sort_col.asc())
+            query = query.order_by(sort_col.asc(), Product.id.asc())
         else:
-            query = query.order_by(sort_col.desc())
+            query = query.order_by(sort_col.desc(), Product.id.desc())
+        if params.cursor is not None:
+            # A plain tuple binds each value with its column's type (price is stored in cents)
+            last = _decode_product_cursor(params.cursor, params.sort_by)
+            after = key > last if params.sort_order == SortOrder.asc else key < last
+        cursor_for = functools.partial(_encode_product_cursor, sort_by=params.sort_by)
 
     # Optional filters
     if params.category_id is not None:
@@ -85,7 +154,17 @@ async def list_products(
     if params.is_active is not None:
         query = query.where(Product.is_active == params.is_active)
 
-    return await paginate(db, query, params.page, params.per_page, ProductResponse)
+    listing = await paginate(
+        db,
+        query,
+        params.page,
+        params.per_page,
+        ProductResponse,
+        estimate_total=True,
+        after=after,
+        cursor_for=cursor_for,
+    )
+    return model_json_response(listing)
 
 
 @router.post(
@@ -109,6 +188,10 @@ async def create_product(
     Returns 400 if ``category_id`` references a non-existent category.
     Returns 400 if the SKU is already in use.
     """
+    category = await db.get(Category, body.category_id)
+    if category is None:
+        raise _INVALID_CATEGORY
+
     product = Product(
         name=body.name,
         sku=body.sku,
@@ -118,8 +201,10 @@ async def create_product(
         category_id=body.category_id,
         is_active=body.is_active,
     )
+    # Attach the category we already hold so the response needs no reload query
+    set_committed_value(product, "category", category)
     db.add(product)
-    await db.flush()  # assign PK before audit record
+    await db.flush()  # INSERT ... RETURNING assigns the PK and timestamps
 
     await record_audit(
         db,
@@ -136,24 +221,16 @@ async def create_product(
             "category_id": str(body.category_id),
             "is_active": body.is_active,
         },
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
 
     try:
         await db.commit()
-        await db.refresh(product)
     except IntegrityError:
         await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category_id: referenced category does not exist",
-        ) from None
-
-    # Reload with category relationship for the response schema
-    result = await db.execute(
-        select(Product).where(Product.id == product.id).options(selectinload(Product.category))
-    )
-    return ProductResponse.model_validate(result.scalar_one())
+        raise _INVALID_CATEGORY from None
+
+    return ProductResponse.model_validate(product)
 
 
 @router.get(
@@ -168,11 +245,12 @@ async def get_product(
     product_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> ProductDetailResponse:
-    """Return a single product with full details including per-warehouse stock levels."""
-    result = await db.execute(
-        select(Product).where(Product.id == product_id).options(selectinload(Product.category))
-    )
-    product = result.scalar_one_or_none()
+    """Return a single product with full details including per-warehouse stock levels.
+
+    Both many-to-one relationships are joined into their parent query, so the
+    endpoint costs two statements rather than four.
+    """
+    product = await db.get(Product, product_id, options=[joinedload(Product.category)])
     if product is None:
         raise _NOT_FOUND
 
@@ -180,7 +258,7 @@ async def get_product(
     sl_result = await db.execute(
         select(StockLevel)
         .where(StockLevel.product_id == product_id)
-        .options(selectinload(StockLevel.warehouse))
+        .options(joinedload(StockLevel.warehouse))
     )
     stock_levels = sl_result.scalars().all()
 
@@ -224,22 +302,28 @@ async def update_product(
     Returns 400 if ``category_id`` references a non-existent category or SKU is
     already in use.
     """
-    result = await db.execute(select(Product).where(Product.id == product_id))
-    product = result.scalar_one_or_none()
+    product = await db.get(Product, product_id, options=[joinedload(Product.category)])
     if product is None:
         raise _NOT_FOUND
 
     update_data = body.model_dump(exclude_unset=True)
-    changes: dict[str, dict[str, Any]] = {}
 
-    for field, new_value in update_data.items():
-        old_value = getattr(product, field)
-        if old_value != new_value:
-            changes[field] = {
-                "old": _serialize_value(old_value),
-                "new": _serialize_value(new_value),
-            }
-            setattr(product, field, new_value)
+    new_category_id = update_data.get("category_id")
+    if new_category_id is not None and new_category_id != product.category_id:
+        category = await db.get(Category, new_category_id)
+        if category is None:
+            raise _INVALID_CATEGORY
+        product.category = category
+
+    # Compare against the loaded column values directly; skips the descriptor per field
+    loaded = product.__dict__
+    changed = {field: value for field, value in update_data.items() if loaded[field] != value}
+    changes = {
+        field: {"old": _serialize_value(loaded[field]), "new": _serialize_value(value)}
+        for field, value in changed.items()
+    }
+    for field, value in changed.items():
+        setattr(product, field, value)
 
     if changes:
         await record_audit(
@@ -249,11 +333,10 @@ async def update_product(
             resource_type="product",
             resource_id=product_id,
             changes=changes,
-            ip_address=request.client.host if request.client else None,
+            ip_address=client_ip(request),
         )
         try:
             await db.commit()
-            await db.refresh(product)
         except IntegrityError:
             await db.rollback()
             raise HTTPException(
@@ -261,11 +344,7 @@ async def update_product(
                 detail="Invalid category_id or SKU already in use",
             ) from None
 
-    # Reload with category relationship for the response schema
-    result = await db.execute(
-        select(Product).where(Product.id == product_id).options(selectinload(Product.category))
-    )
-    return ProductResponse.model_validate(result.scalar_one())
+    return ProductResponse.model_validate(product)
 
 
 @router.delete(
@@ -288,8 +367,7 @@ async def delete_product(
     Sets ``is_active=False`` rather than deleting the row so that FK references
     from stock levels, transfers, and audit logs remain intact.
     """
-    result = await db.execute(select(Product).where(Product.id == product_id))
-    product = result.scalar_one_or_none()
+    product = await db.get(Product, product_id)
     if product is None:
         raise _NOT_FOUND
 
@@ -302,6 +380,6 @@ async def delete_product(
         resource_type="product",
         resource_id=product_id,
         changes={"name": product.name, "sku": product.sku},
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     await db.commit()
@@ -1,21 +1,82 @@
 """Showcase endpoints — public stats API and HTML landing page."""
 
+import asyncio
+import gzip
+import hashlib
+import json
 import pathlib
+import string
+import time
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.responses import HTMLResponse
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, func, literal, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import get_db
+from src.database import AsyncSessionLocal
 from src.models import AuditLog, Category, Product, StockLevel, StockTransfer, Warehouse
+from src.models.base import Base
 from src.schemas.showcase import ShowcaseStats
+from src.utils.pagination import estimated_count
 
 router = APIRouter(prefix="/showcase", tags=["Showcase"])
 root_router = APIRouter()
 
 _TEMPLATE_PATH = pathlib.Path(__file__).parent.parent / "templates" / "landing.html"
-_LANDING_HTML: str = _TEMPLATE_PATH.read_text(encoding="utf-8")
+_STATIC_DIR = pathlib.Path(__file__).parent.parent / "static"
+_ASSET_MEDIA_TYPES = {".css": "text/css; charset=utf-8", ".js": "text/javascript; charset=utf-8"}
+_ASSET_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable", "Vary": "Accept-Encoding"}
+
+
+def _load_assets() -> tuple[dict[str, tuple[bytes, bytes, str]], dict[str, str]]:
+    """Read the landing page's CSS/JS under content-hashed file names.
+
+    The hash changes whenever a file does, so browsers may cache each name
+    forever.  Returns ``{hashed_name: (plain, gzipped, media_type)}`` and the
+    template placeholders, e.g. ``{"landing_css": "/static/landing.<hash>.css"}``.
+    """
+    assets: dict[str, tuple[bytes, bytes, str]] = {}
+    urls: dict[str, str] = {}
+    for path in sorted(_STATIC_DIR.iterdir()):
+        media_type = _ASSET_MEDIA_TYPES.get(path.suffix)
+        if media_type is None:
+            continue
+        data = path.read_bytes()
+        hashed = f"{path.stem}.{hashlib.blake2b(data, digest_size=6).hexdigest()}{path.suffix}"
+        assets[hashed] = (data, gzip.compress(data, compresslevel=9, mtime=0), media_type)
+        urls[path.name.replace(".", "_")] = f"/static/{hashed}"
+    return assets, urls
+
+
+_ASSETS, _ASSET_URLS = _load_assets()
+
+#: The stats are public and identical for every caller, so one rendered body is
+#: shared in-process for this long.  Browsers may reuse it for as long.
+_STATS_TTL_SECONDS = 30
+_stats_cache: tuple[float, bytes, str] | None = None
+_stats_lock = asyncio.Lock()
+
+_LANDING_TEMPLATE = string.Template(_TEMPLATE_PATH.read_text(encoding="utf-8"))
+_LANDING_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "Cache-Control": f"public, max-age={_STATS_TTL_SECONDS}",
+    "Vary": "Accept-Encoding",
+    # Lets the browser open the CDN connections and fetch our own CSS while
+    # it is still receiving the HTML.
+    "Link": ", ".join(
+        [
+            "<https://cdn.tailwindcss.com>; rel=preconnect",
+            "<https://cdnjs.cloudflare.com>; rel=preconnect",
+            "<https://fonts.googleapis.com>; rel=preconnect",
+            "<https://fonts.gstatic.com>; rel=preconnect; crossorigin",
+            f"<{_ASSET_URLS['landing_css']}>; rel=preload; as=style",
+        ]
+    ),
+}
+_LANDING_GZ_HEADERS = {**_LANDING_HEADERS, "Content-Encoding": "gzip"}
+#: ``(stats_etag, html, gzipped_html)`` — re-rendered only when the stats change.
+_landing_cache: tuple[str, bytes, bytes] | None = None
 
 
 @router.get(
@@ -24,42 +85,160 @@ _LANDING_HTML: str = _TEMPLATE_PATH.read_text(encoding="utf-8")
     summary="Public showcase statistics",
     description="Returns aggregate counts for the showcase landing page. No authentication required.",
 )
-async def get_showcase_stats(db: AsyncSession = Depends(get_db)) -> ShowcaseStats:  # noqa: B008
-    """Return aggregate counts across all core resources in a single SQL round-trip."""
-    result = await db.execute(
-        select(
-            select(func.count())
-            .where(Product.is_active.is_(True))
-            .scalar_subquery()
-            .label("products"),
-            select(func.count()).select_from(Category).scalar_subquery().label("categories"),
-            select(func.count())
-            .where(Warehouse.is_active.is_(True))
-            .scalar_subquery()
-            .label("warehouses"),
-            select(func.count())
-            .where(StockLevel.quantity < StockLevel.min_threshold)
-            .scalar_subquery()
-            .label("stock_alerts"),
-            select(func.count())
-            .select_from(StockTransfer)
-            .scalar_subquery()
-            .label("stock_transfers"),
-            select(func.count()).select_from(AuditLog).scalar_subquery().label("audit_log_entries"),
-        )
-    )
-    row = result.one()
-    return ShowcaseStats(
-        products=row.products,
-        categories=row.categories,
-        warehouses=row.warehouses,
-        stock_alerts=row.stock_alerts,
-        stock_transfers=row.stock_transfers,
-        audit_log_entries=row.audit_log_entries,
-    )
+async def get_showcase_stats(request: Request) -> Response:
+    """Return aggregate counts across all core resources in a single SQL round-trip.
+
+    The response carries a weak ``ETag``; a matching ``If-None-Match`` gets an
+    empty 304 instead of the body.  There is no ``get_db`` dependency: a
+    session is opened only when the cache needs refreshing.
+    """
+    body, etag = await _load_stats()
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={_STATS_TTL_SECONDS}"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Apply the weak comparison RFC 9110 prescribes for ``If-None-Match``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+async def _load_stats() -> tuple[bytes, str]:
+    """Return the rendered stats body and its ETag, refreshing them after the TTL.
+
+    Concurrent misses wait on a lock so only one of them queries the database.
+    """
+    global _stats_cache
+    cached = _fresh_stats()
+    if cached is not None:
+        return cached
+
+    async with _stats_lock:
+        # Another request may have refreshed the cache while this one waited
+        cached = _fresh_stats()
+        if cached is None:
+            async with AsyncSessionLocal() as db:
+                stats = await _query_stats(db)
+            body = stats.model_dump_json().encode()
+            etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            cached = (body, etag)
+            _stats_cache = (time.monotonic(), body, etag)
+    return cached
+
+
+def _fresh_stats() -> tuple[bytes, str] | None:
+    """Return the cached body and ETag if they are younger than the TTL."""
+    if _stats_cache is not None:
+        checked_at, body, etag = _stats_cache
+        if time.monotonic() - checked_at < _STATS_TTL_SECONDS:
+            return body, etag
+    return None
+
+
+def _tagged_count(field: str, total: ColumnElement[int]) -> Select[tuple[str, int]]:
+    return select(literal(field).label("field"), total.label("total"))
+
+
+def _table_total(model: type[Base]) -> ColumnElement[int]:
+    exact = select(func.count()).select_from(model)
+    return estimated_count(exact, model.__tablename__).scalar_subquery()
+
+
+# Each count is tagged with its field name and the six are glued with
+# UNION ALL, so PostgreSQL plans them as sibling branches of one Append node.
+# The unfiltered counts go through estimated_count, which answers from
+# pg_class.reltuples once a table outgrows an exact scan.  Built once: the
+# statement object memoizes its cache key, so executions skip construction
+# and go straight to the compiled-SQL cache.
+_STATS_STMT = union_all(
+    _tagged_count("products", func.count()).where(Product.is_active.is_(True)),
+    _tagged_count("categories", _table_total(Category)),
+    _tagged_count("warehouses", func.count()).where(Warehouse.is_active.is_(True)),
+    _tagged_count("stock_alerts", func.count()).where(
+        StockLevel.quantity < StockLevel.min_threshold
+    ),
+    _tagged_count("stock_transfers", _table_total(StockTransfer)),
+    _tagged_count("audit_log_entries", _table_total(AuditLog)),
+)
+
+
+async def _query_stats(db: AsyncSession) -> ShowcaseStats:
+    """Run the six counts behind :func:`get_showcase_stats` as one statement."""
+    result = await db.execute(_STATS_STMT)
+    return ShowcaseStats.model_validate(dict(result.tuples().all()))
 
 
 @root_router.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def landing_page() -> str:
-    """Serve the ShipAPI showcase landing page."""
-    return _LANDING_HTML
+async def landing_page(request: Request) -> Response:
+    """Serve the ShipAPI showcase landing page, gzipped when the client accepts it.
+
+    The live counts are rendered into the HTML, so the page needs no follow-up
+    request to ``/showcase/stats``.
+    """
+    plain, gz = await _load_landing()
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(content=gz, headers=_LANDING_GZ_HEADERS)
+    return Response(content=plain, headers=_LANDING_HEADERS)
+
+
+async def _load_landing() -> tuple[bytes, bytes]:
+    """Return the landing page as plain and gzipped bytes for the current stats.
+
+    The stats must not take the homepage down with them: when the database
+    cannot be reached the last rendered page is served, or failing that one
+    with "—" in place of each count.  Neither fallback replaces the cache.
+    """
+    global _landing_cache
+    try:
+        body, etag = await _load_stats()
+    except (SQLAlchemyError, OSError):
+        if _landing_cache is not None:
+            return _landing_cache[1], _landing_cache[2]
+        html = _render_landing(dict.fromkeys(ShowcaseStats.model_fields, "—"))
+        return html, gzip.compress(html, compresslevel=9, mtime=0)
+    if _landing_cache is None or _landing_cache[0] != etag:
+        html = _render_landing({field: f"{value:,}" for field, value in json.loads(body).items()})
+        _landing_cache = (etag, html, gzip.compress(html, compresslevel=9, mtime=0))
+    return _landing_cache[1], _landing_cache[2]
+
+
+def _render_landing(counts: dict[str, str]) -> bytes:
+    return _LANDING_TEMPLATE.substitute(_ASSET_URLS, **counts).encode("utf-8")
+
+
+@root_router.get("/static/{filename}", include_in_schema=False)
+async def static_asset(filename: str, request: Request) -> Response:
+    """Serve a content-hashed landing page asset with a one-year immutable cache."""
+    asset = _ASSETS.get(filename)
+    if asset is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    plain, gz, media_type = asset
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=gz,
+            media_type=media_type,
+            headers={**_ASSET_HEADERS, "Content-Encoding": "gzip"},
+        )
+    return Response(content=plain, media_type=media_type, headers=_ASSET_HEADERS)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` value allows gzip (``q=0`` refuses it)."""
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        param = params.strip().lower()
+        if not param.startswith("q="):
+            return True
+        try:
+            return float(param[2:]) > 0
+        except ValueError:
+            return False
+    return False
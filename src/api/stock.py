@@ -1,14 +1,14 @@
 """Stock management endpoints: upsert stock levels, atomic transfers, and low-stock alerts."""
 
-import math
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_current_user, get_db
+from src.middleware.client_ip import client_ip
 from src.models import User
 from src.schemas.common import ErrorResponse, PaginatedResponse, Pagination
 from src.schemas.stock import (
@@ -21,6 +21,7 @@ from src.schemas.stock import (
     WarehouseSummary,
 )
 from src.services.stock import get_stock_alerts, transfer_stock, upsert_stock_level
+from src.utils.responses import model_json_response
 
 router = APIRouter(prefix="/stock", tags=["Stock"])
 
@@ -56,7 +57,7 @@ async def update_stock_level(
         warehouse_id=warehouse_id,
         request=body,
         current_user=current_user,
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     return StockLevelResponse.model_validate(stock_level)
 
@@ -86,7 +87,7 @@ async def create_transfer(
         db,
         request=body,
         current_user=current_user,
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     return TransferResponse.model_validate(transfer)
 
@@ -102,12 +103,13 @@ async def list_stock_alerts(
     q: Annotated[_PaginationQuery, Depends()],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> PaginatedResponse[StockAlertResponse]:
+) -> Response:
     """Return stock levels below their minimum threshold, sorted by deficit (descending)."""
     stock_levels, total = await get_stock_alerts(db, page=q.page, size=q.per_page)
-    total_pages = math.ceil(total / q.per_page) if q.per_page > 0 else 0
+    total_pages = (total + q.per_page - 1) // q.per_page if q.per_page > 0 else 0
+    # The summaries are validated from the ORM rows; the rest are plain ints.
     alerts = [
-        StockAlertResponse(
+        StockAlertResponse.model_construct(
             product=ProductSummary.model_validate(stock.product),
             warehouse=WarehouseSummary.model_validate(stock.warehouse),
             quantity=stock.quantity,
@@ -116,9 +118,10 @@ async def list_stock_alerts(
         )
         for stock in stock_levels
     ]
-    return PaginatedResponse[StockAlertResponse](
+    listing = PaginatedResponse[StockAlertResponse](
         data=alerts,
         pagination=Pagination(
             page=q.page, per_page=q.per_page, total=total, total_pages=total_pages
         ),
     )
+    return model_json_response(listing)
@@ -1,15 +1,15 @@
 """Warehouse CRUD endpoints."""
 
-import math
 import uuid
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_current_user, get_db, require_admin
+from src.middleware.client_ip import client_ip
 from src.models import User
 from src.models.audit_log import AuditLog
 from src.models.warehouse import Warehouse
@@ -22,6 +22,7 @@ from src.schemas.warehouse import (
     WarehouseUpdate,
 )
 from src.services.stock import get_warehouse_stock_summary, list_warehouse_stock
+from src.utils.responses import model_json_response
 
 router = APIRouter(prefix="/warehouses", tags=["Warehouses"])
 
@@ -42,7 +43,7 @@ async def list_warehouses(
     q: Annotated[_PaginationQuery, Depends()],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> PaginatedResponse[WarehouseResponse]:
+) -> Response:
     """Return a paginated list of all warehouses."""
     count_result = await db.execute(select(func.count()).select_from(Warehouse))
     total: int = count_result.scalar_one()
@@ -53,13 +54,14 @@ async def list_warehouses(
     )
     warehouses = list(result.scalars().all())
 
-    total_pages = math.ceil(total / q.per_page) if q.per_page > 0 else 0
-    return PaginatedResponse[WarehouseResponse](
+    total_pages = (total + q.per_page - 1) // q.per_page if q.per_page > 0 else 0
+    listing = PaginatedResponse[WarehouseResponse](
         data=[WarehouseResponse.model_validate(w) for w in warehouses],
         pagination=Pagination(
             page=q.page, per_page=q.per_page, total=total, total_pages=total_pages
         ),
     )
+    return model_json_response(listing)
 
 
 @router.post(
@@ -93,7 +95,7 @@ async def create_warehouse(
         resource_type="warehouse",
         resource_id=warehouse.id,
         changes={"name": body.name, "location": body.location, "capacity": body.capacity},
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     db.add(audit)
     await db.commit()
@@ -183,7 +185,7 @@ async def update_warehouse(
         resource_type="warehouse",
         resource_id=warehouse.id,
         changes=changes,
-        ip_address=request.client.host if request.client else None,
+        ip_address=client_ip(request),
     )
     db.add(audit)
     await db.commit()
@@ -204,17 +206,18 @@ async def list_warehouse_stock_levels(
     q: Annotated[_PaginationQuery, Depends()],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> PaginatedResponse[StockLevelResponse]:
+) -> Response:
     """Return paginated stock levels for a warehouse."""
     exists_result = await db.execute(select(Warehouse).where(Warehouse.id == warehouse_id))
     if exists_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
 
     stock_levels, total = await list_warehouse_stock(db, warehouse_id, page=q.page, size=q.per_page)
-    total_pages = math.ceil(total / q.per_page) if q.per_page > 0 else 0
-    return PaginatedResponse[StockLevelResponse](
+    total_pages = (total + q.per_page - 1) // q.per_page if q.per_page > 0 else 0
+    listing = PaginatedResponse[StockLevelResponse](
         data=[StockLevelResponse.model_validate(s) for s in stock_levels],
         pagination=Pagination(
             page=q.page, per_page=q.per_page, total=total, total_pages=total_pages
         ),
     )
+    return model_json_response(listing)
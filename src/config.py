@@ -11,6 +11,14 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     database_url_direct: str | None = None
+    # Connection pool — size for expected concurrent requests; recycle before
+    # the server or proxy drops idle connections.
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
+    # Compiled-statement LRU per engine; every filter/sort combination of the
+    # list endpoints is its own entry, so keep well above SQLAlchemy's 500.
+    db_query_cache_size: int = 2000
 
     # JWT
     jwt_secret_key: str
@@ -18,6 +26,14 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
+    # Rate limiting — point at redis://host:6379 to share counters across workers
+    # (needs the redis client installed alongside slowapi's ``limits``).
+    rate_limit_storage_uri: str = "memory://"
+    rate_limit_strategy: str = "moving-window"
+
+    # Proxy — trust the right-most X-Forwarded-For entry as the client address
+    trust_proxy_headers: bool = False
+
     # App
     app_name: str = "ShipAPI"
     version: str = "1.0.0"
@@ -35,8 +35,10 @@ _url, _connect_args = _asyncpg_url(settings.database_url)
 engine = create_async_engine(
     _url,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    query_cache_size=settings.db_query_cache_size,
     connect_args=_connect_args,
 )
 
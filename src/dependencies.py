@@ -1,5 +1,6 @@
 """FastAPI dependencies: DB session, current-user extraction, and role guards."""
 
+import time
 import uuid
 
 from fastapi import Depends, HTTPException, Security, status
@@ -10,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.models import User
-from src.services.auth import decode_token, verify_api_key
+from src.services.auth import decode_token, hash_api_key, verify_api_key
 
 __all__ = ["get_db", "get_current_user", "require_admin"]
 
@@ -69,8 +70,25 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
 # ---------------------------------------------------------------------------
 
 
-async def _user_from_token(token: str, db: AsyncSession) -> User:
-    """Resolve a Bearer JWT to a live, active ``User`` row."""
+# Verified access token -> (cache deadline, user id).  Clients reuse one token
+# for many requests, so this skips the signature check and claim parsing on
+# repeats.  Only the token's identity is cached: the user row is still loaded
+# per request, so deactivation and role changes take effect immediately.
+_TOKEN_CACHE_TTL_SECONDS = 30
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: dict[str, tuple[float, uuid.UUID]] = {}
+
+
+def _user_id_from_token(token: str) -> uuid.UUID:
+    """Return the subject of a valid access token, memoised for a short TTL."""
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        deadline, user_id = cached
+        if now < deadline:
+            return user_id
+        del _token_cache[token]
+
     try:
         payload = decode_token(token)
     except JWTError:
@@ -79,15 +97,22 @@ async def _user_from_token(token: str, db: AsyncSession) -> User:
     if payload.get("type") != "access":
         raise _CREDENTIALS_EXCEPTION
 
-    raw_id: str | None = payload.get("sub")
-    if not raw_id:
-        raise _CREDENTIALS_EXCEPTION
-
     try:
-        user_id = uuid.UUID(raw_id)
+        user_id = uuid.UUID(payload["sub"])
     except ValueError:
         raise _CREDENTIALS_EXCEPTION from None
 
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts keep insertion order).
+        del _token_cache[next(iter(_token_cache))]
+    # Never outlive the token itself.
+    _token_cache[token] = (min(now + _TOKEN_CACHE_TTL_SECONDS, float(payload["exp"])), user_id)
+    return user_id
+
+
+async def _user_from_token(token: str, db: AsyncSession) -> User:
+    """Resolve a Bearer JWT to a live, active ``User`` row."""
+    user_id = _user_id_from_token(token)
     user: User | None = await db.get(User, user_id)
     if user is None or not user.is_active:
         raise _CREDENTIALS_EXCEPTION
@@ -96,9 +121,12 @@ async def _user_from_token(token: str, db: AsyncSession) -> User:
 
 
 async def _user_from_api_key(api_key: str, db: AsyncSession) -> User:
-    """Resolve an ``X-API-Key`` value to a live, active ``User`` row."""
-    prefix = api_key[:8]
-    result = await db.execute(select(User).where(User.api_key_prefix == prefix))
+    """Resolve an ``X-API-Key`` value to a live, active ``User`` row.
+
+    The lookup is an exact match on the digest, served by the unique index on
+    ``api_key_hash``; the display prefix is neither indexed nor unique.
+    """
+    result = await db.execute(select(User).where(User.api_key_hash == hash_api_key(api_key)))
     user: User | None = result.scalar_one_or_none()
 
     if user is None or user.api_key_hash is None:
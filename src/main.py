@@ -12,6 +12,7 @@ from src.api.router import api_router
 from src.api.showcase import root_router
 from src.database import engine
 from src.middleware.access_log import AccessLogMiddleware
+from src.middleware.client_ip import ClientIpMiddleware
 from src.middleware.error_handler import (
     http_exception_handler,
     integrity_error_handler,
@@ -20,6 +21,7 @@ from src.middleware.error_handler import (
 )
 from src.middleware.rate_limit import limiter, rate_limit_exceeded_handler
 from src.middleware.request_id import RequestIdMiddleware
+from src.utils.responses import PydanticJSONResponse
 
 _OPENAPI_TAGS = [
     {"name": "Health", "description": "Health check endpoints"},
@@ -50,6 +52,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=_OPENAPI_TAGS,
+    default_response_class=PydanticJSONResponse,
 )
 
 # ---------------------------------------------------------------------------
@@ -81,6 +84,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ClientIpMiddleware resolves the caller address once for the audited endpoints.
+app.add_middleware(ClientIpMiddleware)
+
 # AccessLogMiddleware reads REQUEST_ID_CTX written by RequestIdMiddleware, so it
 # must run inside it (closer to the application).
 app.add_middleware(AccessLogMiddleware)
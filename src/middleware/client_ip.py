@@ -0,0 +1,56 @@
+"""Client IP middleware for ShipAPI.
+
+Resolves the caller's address once per request and stores it on
+``request.state.client_ip`` so audited write endpoints read a plain attribute
+instead of re-deriving it from the ASGI scope.
+
+With ``TRUST_PROXY_HEADERS=true`` the right-most ``X-Forwarded-For`` entry — the
+one appended by the proxy in front of the app — wins over the socket peer.
+Leave it off unless such a proxy is guaranteed, since clients can send the
+header themselves.
+"""
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import settings
+
+
+def _resolve_ip(scope: Scope) -> str | None:
+    if settings.trust_proxy_headers:
+        # Repeated header lines form one list (RFC 9110), so a proxy that adds
+        # its own line after a client-supplied one still has the last word.
+        forwarded = ",".join(
+            value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name == b"x-forwarded-for"
+        )
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip() or None
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+class ClientIpMiddleware:
+    """Store the resolved client address on ``request.state.client_ip``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["client_ip"] = _resolve_ip(scope)
+        await self.app(scope, receive, send)
+
+
+def client_ip(request: Request) -> str | None:
+    """Return the caller's address for audit records.
+
+    Uses the value stored by :class:`ClientIpMiddleware`, falling back to the
+    socket peer when the middleware is not installed (e.g. bare test apps).
+    """
+    try:
+        ip: str | None = request.state.client_ip
+    except AttributeError:
+        return request.client.host if request.client else None
+    return ip
@@ -60,6 +60,9 @@ response headers::
 """
 
 import hashlib
+import math
+import time
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import Request
@@ -75,6 +78,7 @@ from src.config import settings
 from src.schemas.common import ErrorCode, ErrorResponse
 
 __all__ = [
+    "ShortCircuitLimiter",
     "limiter",
     "get_remote_address",
     "get_user_key",
@@ -135,6 +139,10 @@ async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded)
         status_code=429,
         content=body.model_dump(),
     )
+    retry_after: int | None = getattr(request.state, "rate_limit_retry_after", None)
+    if retry_after is not None:
+        # Short-circuited by ShortCircuitLimiter; the backend was not consulted.
+        resp.headers["Retry-After"] = str(retry_after)
     view_rate_limit = getattr(request.state, "view_rate_limit", None)
     if view_rate_limit is not None:
         try:
@@ -150,10 +158,78 @@ async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded)
 # Limiter singleton
 # ---------------------------------------------------------------------------
 
-#: Shared rate-limiter instance.  Uses in-memory storage (resets on container
-#: restart — acceptable for a single-instance showcase deployment).
+_EXHAUSTED_CACHE_MAX_SIZE = 100_000
+
+
+class ShortCircuitLimiter(Limiter):
+    """``Limiter`` that remembers exhausted callers and rejects them locally.
+
+    Once the storage backend rejects a request, the caller's fingerprint (path,
+    client address, ``Authorization`` and ``X-API-Key``) is held in process
+    memory until the window's reset time.  Further requests with the same
+    fingerprint get a 429 without a storage round-trip — during a flood from
+    one client, Redis sees one rejection per window instead of one per request.
+    The fingerprint is at least as specific as every key function in use, so a
+    cached block never applies to a different caller.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._exhausted: dict[tuple[str, ...], tuple[float, Any]] = {}
+
+    def _check_request_limit(
+        self,
+        request: Request,
+        endpoint_func: Callable[..., Any] | None,
+        in_middleware: bool = True,
+    ) -> None:
+        fingerprint = (
+            request.method,
+            request.url.path,
+            get_remote_address(request),
+            request.headers.get("Authorization", ""),
+            request.headers.get("X-API-Key", ""),
+        )
+        now = time.time()
+        blocked = self._exhausted.get(fingerprint)
+        if blocked is not None:
+            reset_at, failed_limit = blocked
+            if now < reset_at:
+                request.state.rate_limit_retry_after = math.ceil(reset_at - now)
+                raise RateLimitExceeded(failed_limit)
+            del self._exhausted[fingerprint]
+
+        try:
+            super()._check_request_limit(request, endpoint_func, in_middleware)
+        except RateLimitExceeded as exc:
+            limit_item, args = request.state.view_rate_limit
+            reset_at = self.limiter.get_window_stats(limit_item, *args)[0]
+            if len(self._exhausted) >= _EXHAUSTED_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts keep insertion order).
+                del self._exhausted[next(iter(self._exhausted))]
+            self._exhausted[fingerprint] = (reset_at, exc.limit)
+            raise
+
+    def reset(self) -> None:
+        """Reset the storage backend and forget locally cached blocks."""
+        super().reset()
+        self._exhausted.clear()
+
+
+#: Shared rate-limiter instance.  Storage comes from ``RATE_LIMIT_STORAGE_URI``:
+#: the default ``memory://`` is per-process (resets on container restart and is
+#: not shared between uvicorn workers), while a ``redis://`` URI gives every
+#: worker one set of counters.  The moving-window strategy stops a client from
+#: spending a full limit on each side of a fixed-window boundary.  Rejections
+#: are cached in-process by :class:`ShortCircuitLimiter`, so an exhausted client
+#: stops costing storage round-trips until its window resets.
 #:
 #: ``headers_enabled=True`` enables ``X-RateLimit-*`` header injection by the
 #: ``@limiter.limit()`` decorator when the decorated endpoint declares a
 #: ``response: Response`` parameter.
-limiter: Limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
+limiter: Limiter = ShortCircuitLimiter(
+    key_func=get_remote_address,
+    headers_enabled=True,
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy=settings.rate_limit_strategy,
+)
@@ -1,20 +1,40 @@
+import ipaddress
 import uuid
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import ForeignKey, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from src.models.base import Base, TimestampMixin, UUIDMixin
+from src.models.base import Base, TimestampMixin, UUID7Mixin
 
 if TYPE_CHECKING:
     from src.models.user import User
 
 
-class AuditLog(UUIDMixin, TimestampMixin, Base):
+class AuditLog(UUID7Mixin, TimestampMixin, Base):
     __tablename__ = "audit_logs"
     __table_args__ = (
         Index("ix_audit_logs_resource_type_created_at", "resource_type", "created_at"),
+        # Leads with user_id, so it also serves the foreign key.
+        Index(
+            "ix_audit_logs_user_id_created_at",
+            "user_id",
+            "created_at",
+            postgresql_include=["action", "resource_type"],
+        ),
+        Index(
+            "ix_audit_logs_action_resource_type_created_at",
+            "action",
+            "resource_type",
+            "created_at",
+        ),
+        Index(
+            "ix_audit_logs_changes",
+            "changes",
+            postgresql_using="gin",
+            postgresql_ops={"changes": "jsonb_path_ops"},
+        ),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -25,10 +45,25 @@ class AuditLog(UUIDMixin, TimestampMixin, Base):
     resource_type: Mapped[str] = mapped_column(String(50), nullable=False)
     resource_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
     changes: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(INET, nullable=True)
 
     user: Mapped["User"] = relationship("User")
 
+    @validates("ip_address")
+    def _validate_ip_address(self, key: str, value: str | None) -> str | None:
+        """Store ``None`` for client hosts that are not IP addresses.
+
+        INET rejects anything else, and some ASGI servers and test clients
+        report a hostname (e.g. ``"testclient"``) as the peer.
+        """
+        if value is None:
+            return None
+        try:
+            ipaddress.ip_address(value)
+        except ValueError:
+            return None
+        return value
+
     def __repr__(self) -> str:
         return (
             f"<AuditLog id={self.id!r} action={self.action!r} resource_type={self.resource_type!r}>"
@@ -1,7 +1,9 @@
+import os
+import time
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -9,10 +11,33 @@ class Base(DeclarativeBase):
     pass
 
 
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered (RFC 9562 version 7) UUID.
+
+    The leading 48 bits are the Unix time in milliseconds, so successive ids
+    land on the rightmost leaf of the primary-key B-tree instead of at random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class UUIDMixin:
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
         default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
+    )
+
+
+class UUID7Mixin:
+    """Time-ordered primary key for append-heavy tables."""
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
     )
 
 
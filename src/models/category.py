@@ -18,6 +18,7 @@ class Category(UUIDMixin, TimestampMixin, Base):
     parent_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     parent: Mapped["Category | None"] = relationship(
@@ -2,11 +2,12 @@ import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, Computed, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy import Boolean, CheckConstraint, Computed, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin, UUIDMixin
+from src.models.types import Cents, Grams
 
 if TYPE_CHECKING:
     from src.models.category import Category
@@ -14,19 +15,30 @@ if TYPE_CHECKING:
 
 class Product(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "products"
+    # Heap fillfactor is 70 (set by migration f3a7c9d1e5b2) to keep updates HOT.
     __table_args__ = (
-        CheckConstraint("price >= 0", name="ck_products_price_non_negative"),
-        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        CheckConstraint("price_cents >= 0", name="ck_products_price_non_negative"),
+        Index(
+            "ix_products_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_ops={"search_vector": "tsvector_ops"},
+            postgresql_with={"fastupdate": "on", "gin_pending_list_limit": 8192},
+        ),
     )
+    # Fetch updated_at (and other server-side values) via RETURNING on UPDATE too,
+    # so write endpoints can respond without refreshing the row.
+    __mapper_args__ = {"eager_defaults": True}
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     sku: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    weight_kg: Mapped[Decimal | None] = mapped_column(Numeric(8, 3), nullable=True)
+    price: Mapped[Decimal] = mapped_column("price_cents", Cents, nullable=False)
+    weight_kg: Mapped[Decimal | None] = mapped_column("weight_grams", Grams, nullable=True)
     category_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("categories.id"),
         nullable=False,
+        index=True,
     )
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     search_vector: Mapped[str] = mapped_column(
@@ -1,22 +1,29 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base, TimestampMixin, UUIDMixin
+from src.models.base import Base, TimestampMixin, UUID7Mixin
 
 if TYPE_CHECKING:
     from src.models.product import Product
     from src.models.warehouse import Warehouse
 
 
-class StockLevel(UUIDMixin, TimestampMixin, Base):
+class StockLevel(UUID7Mixin, TimestampMixin, Base):
     __tablename__ = "stock_levels"
+    # Heap fillfactor is 70 (set by migration f3a7c9d1e5b2) to keep updates HOT.
     __table_args__ = (
         UniqueConstraint("product_id", "warehouse_id", name="uq_stock_levels_product_warehouse"),
         CheckConstraint("quantity >= 0", name="ck_stock_levels_quantity_non_negative"),
         CheckConstraint("min_threshold >= 0", name="ck_stock_levels_min_threshold_non_negative"),
+        # Partial: holds only alerting rows, keyed by deficit for the alerts listing.
+        Index(
+            "ix_stock_levels_alerts",
+            text("(min_threshold - quantity)"),
+            postgresql_where=text("quantity < min_threshold"),
+        ),
     )
 
     product_id: Mapped[uuid.UUID] = mapped_column(
@@ -26,6 +33,7 @@ class StockLevel(UUIDMixin, TimestampMixin, Base):
     warehouse_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("warehouses.id"),
         nullable=False,
+        index=True,
     )
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     min_threshold: Mapped[int] = mapped_column(Integer, nullable=False, default=10)
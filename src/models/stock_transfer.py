@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import CheckConstraint, ForeignKey, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base, TimestampMixin, UUIDMixin
+from src.models.base import Base, TimestampMixin, UUID7Mixin
 
 if TYPE_CHECKING:
     from src.models.product import Product
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from src.models.warehouse import Warehouse
 
 
-class StockTransfer(UUIDMixin, TimestampMixin, Base):
+class StockTransfer(UUID7Mixin, TimestampMixin, Base):
     __tablename__ = "stock_transfers"
     __table_args__ = (
         CheckConstraint("quantity > 0", name="ck_stock_transfers_quantity_positive"),
@@ -25,19 +25,23 @@ class StockTransfer(UUIDMixin, TimestampMixin, Base):
     product_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("products.id"),
         nullable=False,
+        index=True,
     )
     from_warehouse_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("warehouses.id"),
         nullable=False,
+        index=True,
     )
     to_warehouse_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("warehouses.id"),
         nullable=False,
+        index=True,
     )
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     initiated_by: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id"),
         nullable=False,
+        index=True,
     )
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -0,0 +1,42 @@
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class _ScaledInteger(TypeDecorator[Decimal]):
+    """Fixed-point ``Decimal`` stored as an integer count of its smallest unit.
+
+    Postgres aggregates and compares ``int4``/``int8`` natively, whereas
+    ``numeric`` arithmetic is software-emulated.  The ORM attribute stays a
+    ``Decimal`` with ``scale`` places, so schemas and callers are unaffected.
+    """
+
+    scale: int
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        return int(Decimal(value).scaleb(self.scale).to_integral_value())
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Decimal | None:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-self.scale)
+
+
+class Cents(_ScaledInteger):
+    """Currency amount with 2 decimal places, stored as ``BIGINT`` cents."""
+
+    impl = BigInteger
+    scale = 2
+
+
+class Grams(_ScaledInteger):
+    """Weight in kilograms with 3 decimal places, stored as ``INTEGER`` grams."""
+
+    impl = Integer
+    scale = 3
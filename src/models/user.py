@@ -1,4 +1,5 @@
 from sqlalchemy import Boolean, String
+from sqlalchemy.dialects.postgresql import BYTEA, CITEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base, TimestampMixin, UUIDMixin
@@ -7,11 +8,14 @@ from src.models.base import Base, TimestampMixin, UUIDMixin
 class User(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # CITEXT makes both the unique constraint and ``email = :email`` lookups
+    # case-insensitive without wrapping the column in LOWER().
+    email: Mapped[str] = mapped_column(CITEXT, nullable=False, unique=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(20), nullable=False, default="user")
-    api_key_hash: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True)
+    # Raw 32-byte SHA-256 digest; see ``src.services.auth.hash_api_key``.
+    api_key_hash: Mapped[bytes | None] = mapped_column(BYTEA, nullable=True, unique=True)
     api_key_prefix: Mapped[str | None] = mapped_column(String(10), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
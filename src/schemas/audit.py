@@ -46,7 +46,13 @@ class AuditLogResponse(BaseModel):
 
 
 class AuditLogQuery(BaseModel):
-    """Query parameters for filtering and paginating audit log entries."""
+    """Query parameters for filtering and paginating audit log entries.
+
+    ``cursor`` is the opaque ``pagination.next_cursor`` from a previous page.
+    When given, ``page`` is ignored and the page starts right after that
+    entry, which stays fast at any depth; ``page`` alone is offset-based and
+    slow for deep pages.
+    """
 
     page: int = 1
     per_page: int = 20
@@ -55,3 +61,4 @@ class AuditLogQuery(BaseModel):
     action: str | None = None
     resource_type: str | None = None
     user_id: uuid.UUID | None = None
+    cursor: str | None = None
@@ -17,6 +17,7 @@ class Pagination(BaseModel):
     per_page: int
     total: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class PaginatedResponse[T](BaseModel):
@@ -202,6 +202,14 @@ ProductSortField = Literal["name", "price", "created_at", "sku"]
 
 
 class ProductListParams(BaseModel):
+    """Query parameters for listing products.
+
+    ``cursor`` is the opaque ``pagination.next_cursor`` from a previous page
+    with the same ``sort_by``/``sort_order``.  When given, ``page`` is ignored
+    and the page starts right after that product, which stays fast at any
+    depth.  Cursors do not apply to ``search`` results, which rank by relevance.
+    """
+
     page: int = Field(1, ge=1)
     per_page: int = Field(20, ge=1)
     sort_by: ProductSortField = "created_at"
@@ -211,6 +219,7 @@ class ProductListParams(BaseModel):
     min_price: Decimal | None = Field(None, ge=0)
     max_price: Decimal | None = Field(None, ge=0)
     is_active: bool | None = None
+    cursor: str | None = None
 
     @field_validator("per_page", mode="before")
     @classmethod
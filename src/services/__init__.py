@@ -7,8 +7,10 @@ from src.services.auth import (
     get_api_key_prefix,
     hash_api_key,
     hash_password,
+    hash_password_async,
     verify_api_key,
     verify_password,
+    verify_password_async,
 )
 from src.services.stock import (
     get_stock_alerts,
@@ -30,8 +32,10 @@ __all__ = [
     "get_api_key_prefix",
     "hash_api_key",
     "hash_password",
+    "hash_password_async",
     "verify_api_key",
     "verify_password",
+    "verify_password_async",
     "get_stock_alerts",
     "get_stock_level",
     "get_warehouse_stock_summary",
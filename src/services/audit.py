@@ -3,16 +3,23 @@
 Provides two public async functions:
 - ``record_audit_log`` — called from any write endpoint to persist an audit entry.
 - ``list_audit_logs`` — paginated, filtered read used by the admin audit endpoint.
+
+``encode_audit_cursor`` / ``decode_audit_cursor`` convert between an audit
+entry's ``(created_at, id)`` key and the opaque keyset cursor clients page with.
 """
 
+import base64
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from fastapi import HTTPException
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.audit_log import AuditLog
 from src.schemas.audit import AuditLogQuery
+from src.utils.pagination import estimated_count
 
 
 async def record_audit_log(
@@ -45,6 +52,25 @@ async def record_audit_log(
     return audit
 
 
+def encode_audit_cursor(log: AuditLog) -> str:
+    """Return an opaque keyset cursor pointing just past *log*."""
+    raw = f"{log.created_at.isoformat()},{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_audit_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Return the ``(created_at, id)`` key encoded in *cursor*.
+
+    Raises HTTP 400 if *cursor* was not produced by :func:`encode_audit_cursor`.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, log_id = raw.partition(",")
+        return datetime.fromisoformat(created_at), uuid.UUID(log_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 #: Alias for ``record_audit_log`` — used by ``src/services/__init__.py`` and endpoint modules.
 record_audit = record_audit_log
 
@@ -57,9 +83,24 @@ async def list_audit_logs(
 
     Filters are applied as equality or range constraints based on the fields
     present in *query*.  Results are ordered newest-first by ``created_at``.
-    Returns a ``(logs, total)`` tuple where ``total`` is the count before
-    pagination so callers can compute ``total_pages``.
+    With ``query.cursor`` set, the page is fetched by keyset on
+    ``(created_at, id)`` rather than by offset.  Returns a ``(logs, total)``
+    tuple where ``total`` is the count before pagination so callers can
+    compute ``total_pages``.  For an unfiltered
+    query over a very large table ``total`` is the planner's estimate, since
+    an exact count would scan every row.
     """
+    filtered = any(
+        value is not None
+        for value in (
+            query.start_date,
+            query.end_date,
+            query.action,
+            query.resource_type,
+            query.user_id,
+        )
+    )
+
     stmt = select(AuditLog)
     count_stmt = select(func.count()).select_from(AuditLog)
 
@@ -83,11 +124,19 @@ async def list_audit_logs(
         stmt = stmt.where(AuditLog.user_id == query.user_id)
         count_stmt = count_stmt.where(AuditLog.user_id == query.user_id)
 
+    if not filtered:
+        count_stmt = estimated_count(count_stmt, AuditLog.__tablename__)
+
     total_result = await db.execute(count_stmt)
     total: int = total_result.scalar_one()
 
-    offset = (query.page - 1) * query.per_page
-    stmt = stmt.order_by(AuditLog.created_at.desc()).offset(offset).limit(query.per_page)
+    if query.cursor is not None:
+        stmt = stmt.where(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*decode_audit_cursor(query.cursor))
+        )
+    else:
+        stmt = stmt.offset((query.page - 1) * query.per_page)
+    stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(query.per_page)
 
     result = await db.execute(stmt)
     logs: list[AuditLog] = list(result.scalars().all())
@@ -1,12 +1,15 @@
 """Authentication service: JWT tokens, password hashing, and API key operations."""
 
+import asyncio
+import functools
 import hashlib
 import secrets
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import bcrypt
-from jose import jwt
+from jose import jwk, jwt
+from jose.backends.base import Key
 
 from src.config import settings
 
@@ -25,6 +28,38 @@ def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode(), password_hash.encode())
 
 
+async def hash_password_async(password: str) -> str:
+    """Run :func:`hash_password` in a worker thread.
+
+    bcrypt is deliberately slow and releases the GIL while hashing; running it
+    off the event loop keeps other requests on this worker responsive.
+    """
+    return await asyncio.to_thread(hash_password, password)
+
+
+@functools.cache
+def _dummy_password_hash() -> str:
+    """Return a throwaway bcrypt hash, generated on first use."""
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def _verify_password_or_dummy(password: str, password_hash: str | None) -> bool:
+    if password_hash is None:
+        verify_password(password, _dummy_password_hash())
+        return False
+    return verify_password(password, password_hash)
+
+
+async def verify_password_async(password: str, password_hash: str | None) -> bool:
+    """Run :func:`verify_password` in a worker thread (see :func:`hash_password_async`).
+
+    A ``None`` *password_hash* (no such account) is checked against a dummy
+    hash and returns False, so an unknown email costs the same bcrypt work as
+    a wrong password and cannot be told apart by response time.
+    """
+    return await asyncio.to_thread(_verify_password_or_dummy, password, password_hash)
+
+
 # ---------------------------------------------------------------------------
 # API keys
 # ---------------------------------------------------------------------------
@@ -35,15 +70,14 @@ def generate_api_key() -> str:
     return "sk_" + secrets.token_hex(32)
 
 
-def hash_api_key(api_key: str) -> str:
-    """Return the SHA-256 hex digest of *api_key* for safe storage."""
-    return hashlib.sha256(api_key.encode()).hexdigest()
+def hash_api_key(api_key: str) -> bytes:
+    """Return the raw SHA-256 digest of *api_key* for safe storage."""
+    return hashlib.sha256(api_key.encode()).digest()
 
 
-def verify_api_key(api_key: str, stored_hash: str) -> bool:
+def verify_api_key(api_key: str, stored_hash: bytes) -> bool:
     """Return True if *api_key* matches *stored_hash* (constant-time comparison)."""
-    computed = hashlib.sha256(api_key.encode()).hexdigest()
-    return secrets.compare_digest(computed, stored_hash)
+    return secrets.compare_digest(hash_api_key(api_key), stored_hash)
 
 
 def get_api_key_prefix(api_key: str) -> str:
@@ -56,6 +90,17 @@ def get_api_key_prefix(api_key: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4)
+def _jwt_key(secret: str, algorithm: str) -> Key:
+    """Return the prepared JWT key for *secret*, built once per (secret, algorithm).
+
+    jose otherwise constructs (and, for asymmetric algorithms, parses) the key
+    on every encode and decode.  Keyed on the current settings values, so a
+    changed secret still takes effect.
+    """
+    return jwk.construct(secret, algorithm)
+
+
 def create_access_token(user_id: str, email: str, role: str) -> str:
     """Return a signed HS256 JWT access token valid for *access_token_expire_minutes*."""
     expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
@@ -66,7 +111,8 @@ def create_access_token(user_id: str, email: str, role: str) -> str:
         "type": "access",
         "exp": expire,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    key = _jwt_key(settings.jwt_secret_key, settings.jwt_algorithm)
+    return jwt.encode(payload, key, algorithm=settings.jwt_algorithm)
 
 
 def create_refresh_token(user_id: str) -> str:
@@ -81,9 +127,19 @@ def create_refresh_token(user_id: str) -> str:
         "type": "refresh",
         "exp": expire,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    key = _jwt_key(settings.jwt_secret_key, settings.jwt_algorithm)
+    return jwt.encode(payload, key, algorithm=settings.jwt_algorithm)
+
+
+#: Every token this service issues carries ``exp`` and ``sub``; have jose reject
+#: tokens without them (and a non-string ``sub``) during decoding.
+_DECODE_OPTIONS: dict[str, bool] = {"require_exp": True, "require_sub": True}
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    """Decode and verify *token*.  Raises :exc:`jose.JWTError` if invalid or expired."""
-    return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    """Decode and verify *token*.  Raises :exc:`jose.JWTError` if invalid or expired.
+
+    A successfully decoded payload always has a string ``sub`` and an ``exp``.
+    """
+    key = _jwt_key(settings.jwt_secret_key, settings.jwt_algorithm)
+    return jwt.decode(token, key, algorithms=[settings.jwt_algorithm], options=_DECODE_OPTIONS)
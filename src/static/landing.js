@@ -0,0 +1,110 @@
+(function () {
+  'use strict';
+
+  const DEMO_API_KEY = 'sk_demo_shipapi_2026_showcase_key';
+
+  /** @type {Record<string, {path: string, auth: boolean, label: string}>} */
+  const ENDPOINTS = {
+    products:   { path: '/api/v1/products',     auth: true,  label: 'GET /api/v1/products' },
+    categories: { path: '/api/v1/categories',   auth: false, label: 'GET /api/v1/categories' },
+    warehouses: { path: '/api/v1/warehouses',   auth: true,  label: 'GET /api/v1/warehouses' },
+    alerts:     { path: '/api/v1/stock/alerts', auth: true,  label: 'GET /api/v1/stock/alerts' },
+    health:     { path: '/api/v1/health',       auth: false, label: 'GET /api/v1/health' },
+  };
+
+  // ── API Explorer ───────────────────────────────────────────────────────────
+
+  let activeRow = null;
+
+  async function tryEndpoint(key) {
+    const ep = ENDPOINTS[key];
+    if (!ep) return;
+
+    // Update active row styling
+    document.querySelectorAll('.endpoint-row').forEach(r => r.classList.remove('active'));
+    const rows = document.querySelectorAll('.endpoint-row');
+    const keys = Object.keys(ENDPOINTS);
+    const idx = keys.indexOf(key);
+    if (idx >= 0 && rows[idx]) rows[idx].classList.add('active');
+
+    const titleEl = document.getElementById('response-title');
+    const bodyEl  = document.getElementById('response-body');
+    const statusEl = document.getElementById('response-status');
+    const timeEl  = document.getElementById('response-time');
+
+    titleEl.textContent = ep.label;
+    bodyEl.className = 'text-sm text-gray-500 italic m-0';
+    bodyEl.innerHTML = '// Loading...';
+    statusEl.textContent = '';
+    timeEl.textContent = '';
+
+    const headers = {};
+    if (ep.auth) headers['X-API-Key'] = DEMO_API_KEY;
+
+    const start = performance.now();
+    try {
+      const res = await fetch(ep.path, { headers });
+      const ms = Math.round(performance.now() - start);
+      const json = await res.json();
+      const formatted = JSON.stringify(json, null, 2);
+
+      timeEl.textContent = ms + 'ms';
+      statusEl.textContent = res.status + ' ' + res.statusText;
+      statusEl.className = res.ok
+        ? 'text-xs font-mono text-green-400'
+        : 'text-xs font-mono text-red-400';
+
+      bodyEl.className = 'text-sm m-0';
+      bodyEl.innerHTML = '<code class="language-json">' +
+        formatted.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;') +
+        '</code>';
+      hljs.highlightElement(bodyEl.querySelector('code'));
+    } catch (err) {
+      statusEl.textContent = 'Error';
+      statusEl.className = 'text-xs font-mono text-red-400';
+      bodyEl.className = 'text-sm text-red-400 italic m-0';
+      bodyEl.textContent = '// ' + (err.message || 'Network error');
+    }
+  }
+
+  // ── Copy helpers ────────────────────────────────────────────────────────────
+
+  function copyToClipboard(text, btn, label) {
+    navigator.clipboard.writeText(text).then(() => {
+      if (btn) {
+        const orig = btn.textContent;
+        btn.textContent = label || 'Copied!';
+        btn.classList.add('copied');
+        setTimeout(() => {
+          btn.textContent = orig;
+          btn.classList.remove('copied');
+        }, 1500);
+      }
+    }).catch(() => {});
+  }
+
+  function copyCommand(key, btn) {
+    const ep = ENDPOINTS[key];
+    if (!ep) return;
+    const base = window.location.origin;
+    let cmd = 'curl ' + base + ep.path;
+    if (ep.auth) cmd += ' \\\n  -H "X-API-Key: ' + DEMO_API_KEY + '"';
+    copyToClipboard(cmd, btn, 'Copied!');
+  }
+
+  function copyApiKey() {
+    const btn = document.getElementById('copy-key-btn');
+    copyToClipboard(DEMO_API_KEY, btn, 'Copied!');
+  }
+
+  // Expose to global scope for inline onclick handlers
+  window.tryEndpoint = tryEndpoint;
+  window.copyCommand = copyCommand;
+  window.copyApiKey = copyApiKey;
+
+  // ── Init ───────────────────────────────────────────────────────────────────
+
+  document.addEventListener('DOMContentLoaded', function () {
+    hljs.highlightAll();
+  });
+}());
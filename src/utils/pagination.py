@@ -1,16 +1,54 @@
 """Reusable async pagination utility for SQLAlchemy async sessions."""
 
-import math
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Select,
+    Table,
+    case,
+    cast,
+    column,
+    func,
+    select,
+    table,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.common import PaginatedResponse, Pagination
 
 _MAX_PER_PAGE = 100
 
+#: Unfiltered listings over more rows than this report the planner's row
+#: estimate as ``total`` instead of running an exact ``count(*)``.
+ESTIMATED_COUNT_THRESHOLD = 100_000
+
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+def estimated_count(exact: Select[Any], table_name: str) -> Select[Any]:
+    """Wrap the count query *exact* so large tables report ``pg_class.reltuples``.
+
+    Both live in one statement: Postgres evaluates the uncorrelated count
+    subquery lazily, so it only runs when the estimate is below the threshold
+    (``reltuples`` is ``-1`` for a table that has never been analysed).
+    """
+    estimate = (
+        select(cast(_pg_class.c.reltuples, BigInteger))
+        .where(_pg_class.c.oid == cast(table_name, REGCLASS))
+        .scalar_subquery()
+    )
+    return select(
+        case(
+            (estimate >= ESTIMATED_COUNT_THRESHOLD, estimate),
+            else_=exact.scalar_subquery(),
+        )
+    )
+
 
 async def paginate[T: BaseModel](
     db: AsyncSession,
@@ -18,6 +56,10 @@ async def paginate[T: BaseModel](
     page: int,
     per_page: int,
     schema: type[T],
+    *,
+    estimate_total: bool = False,
+    after: ColumnElement[bool] | None = None,
+    cursor_for: Callable[[Any], str] | None = None,
 ) -> PaginatedResponse[T]:
     """Execute *query* with pagination and return a :class:`PaginatedResponse`.
 
@@ -27,6 +69,12 @@ async def paginate[T: BaseModel](
         page: 1-based page number.  Values < 1 are clamped to 1.
         per_page: Number of items per page.  Clamped to [1, 100].
         schema: Pydantic model class used to validate each ORM row.
+        estimate_total: When *query* selects from a single table with no WHERE
+            clause, let :func:`estimated_count` answer ``total`` for large tables.
+        after: Keyset condition selecting the rows past the previous page.  When
+            given it replaces the offset; ``total`` still counts all of *query*.
+        cursor_for: Builds ``pagination.next_cursor`` from the last row of a
+            full page.
 
     Returns:
         A :class:`PaginatedResponse` containing the page's items and pagination metadata.
@@ -38,14 +86,19 @@ async def paginate[T: BaseModel](
     # Total count via a wrapping subquery so any ORDER BY in the original query
     # is preserved without breaking the COUNT.
     count_query = select(func.count()).select_from(query.subquery())
+    if estimate_total and query.whereclause is None:
+        froms = query.get_final_froms()
+        if len(froms) == 1 and isinstance(froms[0], Table):
+            count_query = estimated_count(count_query, froms[0].name)
     total: int = (await db.execute(count_query)).scalar_one()
 
     # Fetch the requested page
-    offset = (page - 1) * per_page
-    rows_result = await db.execute(query.offset(offset).limit(per_page))
+    page_query = query.where(after) if after is not None else query.offset((page - 1) * per_page)
+    rows_result = await db.execute(page_query.limit(per_page))
     rows = rows_result.scalars().all()
+    next_cursor = cursor_for(rows[-1]) if cursor_for and len(rows) == per_page else None
 
-    total_pages = math.ceil(total / per_page) if total > 0 else 1
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
 
     return PaginatedResponse(
         data=[schema.model_validate(row) for row in rows],
@@ -54,5 +107,6 @@ async def paginate[T: BaseModel](
             per_page=per_page,
             total=total,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
@@ -0,0 +1,36 @@
+"""Response helpers that bypass FastAPI's generic serialization path."""
+
+from typing import Any
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """``JSONResponse`` that encodes with pydantic-core instead of ``json.dumps``.
+
+    Installed as the app's ``default_response_class``.  FastAPI has already
+    reduced the return value to JSON-compatible data via ``response_model``;
+    this swaps only the final encode for the Rust one, which also handles UUID,
+    datetime and Decimal values natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Return *model* as a JSON response rendered by pydantic-core.
+
+    Returning a model normally makes FastAPI re-validate it against
+    ``response_model``, dump it to Python objects, and hand those to
+    ``json.dumps``.  ``model_dump_json`` writes the bytes in one pass in Rust.
+    The route should still declare ``response_model`` for the OpenAPI schema.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
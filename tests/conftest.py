@@ -12,6 +12,7 @@ Fixture scopes
 * ``admin_headers`` — function: register a user and elevate to admin.
 * ``seeded_db``     — function: truncate all tables, seed representative data.
 * ``reset_rate_limiter`` — function, autouse: prevent cross-test counter bleed.
+* ``reset_showcase_stats_cache`` — function, autouse: drop cached showcase stats.
 """
 
 import asyncio
@@ -66,7 +67,7 @@ os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-testing")
 
 @pytest.fixture(autouse=True)
 def reset_rate_limiter() -> None:
-    """Reset the in-memory rate-limit storage before every test.
+    """Reset the in-memory rate-limit storage and cached blocks before every test.
 
     The module-level ``limiter`` singleton accumulates counters across tests
     in the same process.  Without this fixture, low-limit endpoints (e.g.
@@ -74,7 +75,19 @@ def reset_rate_limiter() -> None:
     """
     from src.middleware.rate_limit import limiter
 
-    limiter._storage.reset()
+    limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_showcase_stats_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty showcase stats cache.
+
+    The stats endpoint reuses its last result for a few seconds, which would
+    otherwise serve counts from before a test's own seeding.
+    """
+    from src.api import showcase
+
+    monkeypatch.setattr(showcase, "_stats_cache", None)
 
 
 # ---------------------------------------------------------------------------
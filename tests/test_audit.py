@@ -7,14 +7,19 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from httpx import ASGITransport, AsyncClient
 
 from src.api.audit import router as audit_router
 from src.database import get_db
 from src.models import AuditLog, User
 from src.schemas.audit import AuditLogQuery
-from src.services.audit import list_audit_logs, record_audit_log
+from src.services.audit import (
+    decode_audit_cursor,
+    encode_audit_cursor,
+    list_audit_logs,
+    record_audit_log,
+)
 from src.services.auth import create_access_token
 
 # ---------------------------------------------------------------------------
@@ -125,6 +130,27 @@ async def test_record_audit_log_without_optional_fields() -> None:
     assert added.ip_address is None
 
 
+@pytest.mark.asyncio
+async def test_record_audit_log_drops_non_ip_client_host() -> None:
+    """A client host that is not an IP address (INET column) is stored as None."""
+    db_mock = AsyncMock()
+    db_mock.add = MagicMock()
+    db_mock.commit = AsyncMock()
+    db_mock.refresh = AsyncMock()
+
+    await record_audit_log(
+        db_mock,
+        user_id=uuid.uuid4(),
+        action="create",
+        resource_type="product",
+        resource_id=uuid.uuid4(),
+        ip_address="testclient",
+    )
+
+    added = db_mock.add.call_args[0][0]
+    assert added.ip_address is None
+
+
 # ---------------------------------------------------------------------------
 # list_audit_logs service
 # ---------------------------------------------------------------------------
@@ -273,6 +299,43 @@ async def test_list_audit_logs_empty_result() -> None:
     assert logs == []
 
 
+@pytest.mark.asyncio
+async def test_list_audit_logs_with_cursor() -> None:
+    """list_audit_logs accepts a cursor from encode_audit_cursor."""
+    previous = _make_audit_log()
+    log = _make_audit_log()
+
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 2
+
+    scalars_mock = MagicMock()
+    scalars_mock.all.return_value = [log]
+    logs_result = MagicMock()
+    logs_result.scalars.return_value = scalars_mock
+
+    db_mock = AsyncMock()
+    db_mock.execute = AsyncMock(side_effect=[count_result, logs_result])
+
+    query = AuditLogQuery(per_page=1, cursor=encode_audit_cursor(previous))
+    logs, total = await list_audit_logs(db_mock, query)
+
+    assert total == 2
+    assert logs == [log]
+
+
+def test_audit_cursor_round_trip() -> None:
+    """decode_audit_cursor returns the (created_at, id) key it was built from."""
+    log = _make_audit_log()
+    assert decode_audit_cursor(encode_audit_cursor(log)) == (log.created_at, log.id)
+
+
+def test_decode_audit_cursor_rejects_garbage() -> None:
+    """A cursor that was not issued by the API is a 400, not a server error."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_audit_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # GET /audit-log endpoint
 # ---------------------------------------------------------------------------
@@ -527,6 +590,37 @@ async def test_get_audit_log_response_fields() -> None:
     assert entry["ip_address"] == "192.168.1.1"
 
 
+@pytest.mark.asyncio
+async def test_get_audit_log_full_page_returns_next_cursor() -> None:
+    """A full page carries a next_cursor pointing past its last entry."""
+    admin = _make_user(role="admin")
+    logs = [_make_audit_log(), _make_audit_log()]
+    token = create_access_token(str(admin.id), admin.email, admin.role)
+
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 5
+
+    scalars_mock = MagicMock()
+    scalars_mock.all.return_value = logs
+    logs_result = MagicMock()
+    logs_result.scalars.return_value = scalars_mock
+
+    db_mock = AsyncMock()
+    db_mock.get = AsyncMock(return_value=admin)
+    db_mock.execute = AsyncMock(side_effect=[count_result, logs_result])
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(
+            "/audit-log",
+            params={"per_page": 2},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["pagination"]["next_cursor"] == encode_audit_cursor(logs[-1])
+
+
 # ---------------------------------------------------------------------------
 # Integration tests — real PostgreSQL via async_client + seeded_db
 # ---------------------------------------------------------------------------
@@ -865,3 +959,35 @@ async def test_integration_audit_pagination_envelope(
     assert "total_pages" in pagination
     # With per_page=2, data list has at most 2 items
     assert len(body["data"]) <= 2
+
+
+@pytest.mark.asyncio
+async def test_integration_audit_cursor_continues_after_previous_page(
+    async_client: AsyncClient,
+    seeded_db: dict,
+) -> None:
+    """Following next_cursor yields the entries after the first page, without overlap.
+
+    seeded_db creates 3 products and 2 categories via HTTP, so there are
+    several audit entries to page through.
+    """
+    first = await async_client.get(
+        "/api/v1/audit-log",
+        params={"per_page": 1},
+        headers=seeded_db["admin_auth"],
+    )
+    assert first.status_code == 200
+    first_body = first.json()
+    cursor = first_body["pagination"]["next_cursor"]
+    assert cursor is not None
+
+    second = await async_client.get(
+        "/api/v1/audit-log",
+        params={"per_page": 1, "cursor": cursor},
+        headers=seeded_db["admin_auth"],
+    )
+    assert second.status_code == 200
+    second_data = second.json()["data"]
+    assert len(second_data) == 1
+    assert second_data[0]["id"] != first_body["data"][0]["id"]
+    assert second_data[0]["created_at"] <= first_body["data"][0]["created_at"]
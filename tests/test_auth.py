@@ -92,6 +92,18 @@ async def test_register_duplicate_email_returns_409(async_client: AsyncClient) -
     assert "already registered" in second.json()["error"]["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_register_duplicate_email_is_case_insensitive(async_client: AsyncClient) -> None:
+    """An email differing only in letter case counts as already registered."""
+    payload = _register_payload()
+    first = await async_client.post("/api/v1/auth/register", json=payload)
+    assert first.status_code == 201
+
+    shouted = {**payload, "email": payload["email"].upper()}
+    second = await async_client.post("/api/v1/auth/register", json=shouted)
+    assert second.status_code == 409
+
+
 @pytest.mark.asyncio
 async def test_register_short_password_returns_422(async_client: AsyncClient) -> None:
     """Registering with a password shorter than 8 characters returns HTTP 422."""
@@ -139,6 +151,19 @@ async def test_login_returns_200_with_tokens(async_client: AsyncClient) -> None:
     assert isinstance(body["expires_in"], int)
 
 
+@pytest.mark.asyncio
+async def test_login_email_is_case_insensitive(async_client: AsyncClient) -> None:
+    """Logging in matches the registered email regardless of letter case."""
+    payload = _register_payload()
+    await async_client.post("/api/v1/auth/register", json=payload)
+
+    response = await async_client.post(
+        "/api/v1/auth/login",
+        json={"email": payload["email"].upper(), "password": payload["password"]},
+    )
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_login_wrong_password_returns_401(async_client: AsyncClient) -> None:
     """Logging in with the wrong password returns HTTP 401."""
@@ -260,6 +285,23 @@ async def test_refresh_with_expired_token_returns_401(async_client: AsyncClient)
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_refresh_without_exp_returns_401(async_client: AsyncClient) -> None:
+    """A correctly signed refresh token with no expiry is rejected."""
+    payload = _register_payload()
+    reg_resp = await async_client.post("/api/v1/auth/register", json=payload)
+    user_id = reg_resp.json()["id"]
+
+    token = jwt.encode(
+        {"sub": user_id, "type": "refresh"},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+
+    response = await async_client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+    assert response.status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # GET /api/v1/auth/me
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 from src.api.categories import router as categories_router
@@ -148,6 +149,19 @@ async def test_list_categories_empty_returns_empty_list() -> None:
     assert body["pagination"]["total"] == 0
 
 
+@pytest.mark.asyncio
+async def test_list_categories_count_consults_row_estimate() -> None:
+    """The unfiltered listing lets pg_class.reltuples answer total for large tables."""
+    db_mock = _make_paginated_db_mock([])
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/categories")
+
+    count_stmt = db_mock.execute.await_args_list[0].args[0]
+    assert "reltuples" in str(count_stmt.compile(dialect=postgresql.dialect()))
+
+
 @pytest.mark.asyncio
 async def test_list_categories_includes_parent_id() -> None:
     """GET /categories exposes parent_id on subcategories."""
@@ -395,11 +409,8 @@ async def test_get_category_returns_detail_with_products() -> None:
     product = _make_product(name="Widget", sku="WID-001")
     category = _make_category(name="Electronics", products=[product])
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(return_value=category)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -418,11 +429,8 @@ async def test_get_category_returns_empty_products_list() -> None:
     """GET /categories/{id} returns empty products list when category has no products."""
     category = _make_category(name="Empty Category", products=[])
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(return_value=category)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -435,11 +443,8 @@ async def test_get_category_returns_empty_products_list() -> None:
 @pytest.mark.asyncio
 async def test_get_category_not_found_returns_404() -> None:
     """GET /categories/{id} with an unknown id returns 404."""
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(return_value=None)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -465,11 +470,8 @@ async def test_get_category_no_auth_required() -> None:
     """GET /categories/{id} is a public endpoint — no Authorization header needed."""
     category = _make_category(name="Public Cat")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(return_value=category)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -490,12 +492,8 @@ async def test_update_category_admin_success() -> None:
     token = _token(admin)
     category = _make_category(name="Old Name", description="Old Desc")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock()
     db_mock.refresh = AsyncMock()
 
@@ -520,12 +518,8 @@ async def test_update_category_records_diff_in_audit() -> None:
     token = _token(admin)
     category = _make_category(name="Original Name", description=None)
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock()
     db_mock.refresh = AsyncMock()
 
@@ -551,12 +545,8 @@ async def test_update_category_no_changes_skips_audit_and_commit() -> None:
     token = _token(admin)
     category = _make_category(name="Same Name")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.categories.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -580,12 +570,8 @@ async def test_update_category_empty_body_skips_audit() -> None:
     token = _token(admin)
     category = _make_category(name="Cat")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.categories.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -608,12 +594,8 @@ async def test_update_category_writes_audit_log() -> None:
     token = _token(admin)
     category = _make_category(name="Before")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock()
     db_mock.refresh = AsyncMock()
 
@@ -670,12 +652,8 @@ async def test_update_category_not_found_returns_404() -> None:
     admin = _make_user(role="admin")
     token = _token(admin)
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, None])
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -696,12 +674,8 @@ async def test_update_category_invalid_parent_returns_400() -> None:
     token = _token(admin)
     category = _make_category(name="Cat", parent_id=None)
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = category
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, category])
     db_mock.commit = AsyncMock(side_effect=IntegrityError("FK violation", {}, Exception()))
     db_mock.rollback = AsyncMock()
 
@@ -731,14 +705,12 @@ async def test_delete_category_admin_success() -> None:
     token = _token(admin)
     category = _make_category(name="Empty Cat")
 
-    mock_cat_result = MagicMock()
-    mock_cat_result.scalar_one_or_none.return_value = category
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 0  # no products
+    mock_in_use_result = MagicMock()
+    mock_in_use_result.scalar_one.return_value = False  # no products
 
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(side_effect=[mock_cat_result, mock_count_result])
+    db_mock.get = AsyncMock(side_effect=[admin, category])
+    db_mock.execute = AsyncMock(return_value=mock_in_use_result)
     db_mock.delete = AsyncMock()
     db_mock.commit = AsyncMock()
 
@@ -767,14 +739,12 @@ async def test_delete_category_writes_audit_log() -> None:
     token = _token(admin)
     category = _make_category(name="Deleted Cat")
 
-    mock_cat_result = MagicMock()
-    mock_cat_result.scalar_one_or_none.return_value = category
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 0
+    mock_in_use_result = MagicMock()
+    mock_in_use_result.scalar_one.return_value = False
 
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(side_effect=[mock_cat_result, mock_count_result])
+    db_mock.get = AsyncMock(side_effect=[admin, category])
+    db_mock.execute = AsyncMock(return_value=mock_in_use_result)
     db_mock.delete = AsyncMock()
     db_mock.commit = AsyncMock()
 
@@ -798,14 +768,12 @@ async def test_delete_category_with_products_returns_400() -> None:
     token = _token(admin)
     category = _make_category(name="Busy Cat")
 
-    mock_cat_result = MagicMock()
-    mock_cat_result.scalar_one_or_none.return_value = category
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 3  # 3 products
+    mock_in_use_result = MagicMock()
+    mock_in_use_result.scalar_one.return_value = True  # products assigned
 
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(side_effect=[mock_cat_result, mock_count_result])
+    db_mock.get = AsyncMock(side_effect=[admin, category])
+    db_mock.execute = AsyncMock(return_value=mock_in_use_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -825,14 +793,12 @@ async def test_delete_category_inactive_products_also_blocked() -> None:
     token = _token(admin)
     category = _make_category(name="Cat With Inactive Products")
 
-    mock_cat_result = MagicMock()
-    mock_cat_result.scalar_one_or_none.return_value = category
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = 1  # 1 inactive product still counts
+    mock_in_use_result = MagicMock()
+    mock_in_use_result.scalar_one.return_value = True  # an inactive product still counts
 
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(side_effect=[mock_cat_result, mock_count_result])
+    db_mock.get = AsyncMock(side_effect=[admin, category])
+    db_mock.execute = AsyncMock(return_value=mock_in_use_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -880,12 +846,8 @@ async def test_delete_category_not_found_returns_404() -> None:
     admin = _make_user(role="admin")
     token = _token(admin)
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=mock_result)
+    db_mock.get = AsyncMock(side_effect=[admin, None])
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
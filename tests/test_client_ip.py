@@ -0,0 +1,66 @@
+"""Tests for src/middleware/client_ip.py.
+
+The middleware is exercised through a minimal FastAPI app whose endpoint echoes
+:func:`~src.middleware.client_ip.client_ip`, so the stored value is verified
+through the full request cycle.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.config import settings
+from src.middleware.client_ip import ClientIpMiddleware, client_ip
+
+# ---------------------------------------------------------------------------
+# Test application factory
+# ---------------------------------------------------------------------------
+
+
+def _make_app(*, with_middleware: bool = True) -> FastAPI:
+    """Return a minimal FastAPI app that reports the resolved client address."""
+    app = FastAPI()
+    if with_middleware:
+        app.add_middleware(ClientIpMiddleware)
+
+    @app.get("/ip")
+    async def ip(request: Request) -> dict[str, str | None]:
+        return {"ip": client_ip(request)}
+
+    return app
+
+
+# ---------------------------------------------------------------------------
+# Resolution
+# ---------------------------------------------------------------------------
+
+
+class TestClientIp:
+    def test_uses_socket_peer(self) -> None:
+        res = TestClient(_make_app()).get("/ip")
+        assert res.json()["ip"] == "testclient"
+
+    def test_forwarded_for_ignored_by_default(self) -> None:
+        res = TestClient(_make_app()).get("/ip", headers={"X-Forwarded-For": "203.0.113.7"})
+        assert res.json()["ip"] == "testclient"
+
+    def test_forwarded_for_rightmost_entry_when_trusted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "trust_proxy_headers", True)
+        res = TestClient(_make_app()).get(
+            "/ip", headers={"X-Forwarded-For": "198.51.100.1, 203.0.113.7"}
+        )
+        assert res.json()["ip"] == "203.0.113.7"
+
+    def test_forwarded_for_last_header_line_wins(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "trust_proxy_headers", True)
+        res = TestClient(_make_app()).get(
+            "/ip",
+            headers=[("X-Forwarded-For", "198.51.100.1"), ("X-Forwarded-For", "203.0.113.7")],
+        )
+        assert res.json()["ip"] == "203.0.113.7"
+
+    def test_falls_back_without_middleware(self) -> None:
+        res = TestClient(_make_app(with_middleware=False)).get("/ip")
+        assert res.json()["ip"] == "testclient"
@@ -31,3 +31,9 @@ def test_settings_defaults(monkeypatch):
     s = Settings(_env_file=None)
     assert s.database_url_direct is None
     assert s.jwt_algorithm == "HS256"
+    assert s.rate_limit_storage_uri == "memory://"
+    assert s.rate_limit_strategy == "moving-window"
+    assert s.db_pool_size == 20
+    assert s.db_max_overflow == 40
+    assert s.db_pool_recycle_seconds == 1800
+    assert s.db_query_cache_size == 2000
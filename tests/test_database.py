@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
+from src.config import settings
 from src.database import AsyncSessionLocal, engine, get_db
 
 
@@ -10,7 +11,13 @@ def test_engine_is_async_engine():
 
 def test_engine_has_pool_settings():
     pool = engine.pool
-    assert pool.size() == 5  # type: ignore[attr-defined]
+    assert pool.size() == settings.db_pool_size  # type: ignore[attr-defined]
+    assert pool._max_overflow == settings.db_max_overflow  # type: ignore[attr-defined]
+    assert pool._recycle == settings.db_pool_recycle_seconds
+
+
+def test_engine_compiled_cache_size():
+    assert engine.sync_engine._compiled_cache.capacity == settings.db_query_cache_size  # type: ignore[union-attr]
 
 
 def test_async_session_factory_is_sessionmaker():
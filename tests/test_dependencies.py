@@ -4,7 +4,7 @@ import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import Depends, FastAPI
@@ -16,6 +16,7 @@ from src.models import User
 from src.services.auth import (
     create_access_token,
     create_refresh_token,
+    decode_token,
     generate_api_key,
     hash_api_key,
 )
@@ -155,6 +156,45 @@ async def test_bearer_inactive_user_returns_401():
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_bearer_repeated_token_is_decoded_once():
+    """A token reused across requests is only verified on first use."""
+    user = _make_user()
+    token = create_access_token(str(user.id), user.email, user.role)
+
+    db_mock = AsyncMock()
+    db_mock.get = AsyncMock(return_value=user)
+
+    with patch("src.dependencies.decode_token", wraps=decode_token) as decode_spy:
+        async with _make_client(db_mock) as client:
+            for _ in range(3):
+                response = await client.get(
+                    "/protected", headers={"Authorization": f"Bearer {token}"}
+                )
+                assert response.status_code == 200
+
+    assert decode_spy.call_count == 1
+    assert db_mock.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bearer_cached_token_still_rejects_deactivated_user():
+    """Deactivating a user takes effect even while their token is cached."""
+    user = _make_user()
+    token = create_access_token(str(user.id), user.email, user.role)
+
+    db_mock = AsyncMock()
+    db_mock.get = AsyncMock(return_value=user)
+
+    async with _make_client(db_mock) as client:
+        first = await client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+        user.is_active = False
+        second = await client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+
+    assert first.status_code == 200
+    assert second.status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # API key — happy path
 # ---------------------------------------------------------------------------
@@ -1,13 +1,17 @@
 """Tests for GET /api/v1/health — liveness probe endpoint.
 
-All tests in this module use the real test database via the ``async_client``
+Most tests in this module use the real test database via the ``async_client``
 fixture.  The health endpoint always returns HTTP 200 (Railway liveness
 probe requirement); database reachability is communicated in the JSON body.
 """
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from httpx import AsyncClient
 
+from src.api import health as health_module
+
 
 @pytest.mark.asyncio
 async def test_health_returns_200(async_client: AsyncClient) -> None:
@@ -63,3 +67,21 @@ async def test_health_content_type_json(async_client: AsyncClient) -> None:
     """Health endpoint returns a JSON content-type header."""
     response = await async_client.get("/api/v1/health")
     assert "application/json" in response.headers["content-type"]
+
+
+@pytest.mark.asyncio
+async def test_health_probes_within_ttl_share_one_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Back-to-back probes reuse the last result instead of checking out a connection."""
+    monkeypatch.setattr(health_module, "_last_probe", (float("-inf"), False))
+    conn = MagicMock()
+    conn.execution_options = AsyncMock(return_value=conn)
+    conn.exec_driver_sql = AsyncMock()
+
+    with patch.object(health_module, "engine") as mock_engine:
+        mock_engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+        mock_engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+        first = await health_module.health()
+        second = await health_module.health()
+
+    assert first.database == second.database == "connected"
+    conn.exec_driver_sql.assert_awaited_once_with("SELECT 1")
@@ -131,3 +131,16 @@ async def test_protected_endpoints_declare_both_security_schemes(client):
     assert any("/auth/me" in p for p in auth_required_paths), (
         "Expected GET /api/v1/auth/me to declare security requirements"
     )
+
+
+def test_default_response_class_renders_with_pydantic_core():
+    import uuid
+
+    from src.main import app
+    from src.utils.responses import PydanticJSONResponse
+
+    assert app.router.default_response_class is PydanticJSONResponse
+
+    item_id = uuid.UUID(int=1)
+    rendered = PydanticJSONResponse({"id": item_id, "name": "café"}).body
+    assert rendered == f'{{"id":"{item_id}","name":"café"}}'.encode()
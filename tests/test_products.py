@@ -10,8 +10,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
+from src.api.products import _decode_product_cursor, _encode_product_cursor
 from src.api.products import router as products_router
 from src.database import get_db
 from src.models import Category, Product, StockLevel, User, Warehouse
@@ -236,6 +238,19 @@ async def test_list_products_filter_by_is_active() -> None:
     assert len(response.json()["data"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_products_filtered_count_is_exact() -> None:
+    """A filtered listing always counts its matches instead of using the row estimate."""
+    db_mock = _make_paginated_db_mock([])
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/products?is_active=true")
+
+    count_stmt = db_mock.execute.await_args_list[0].args[0]
+    assert "reltuples" not in str(count_stmt.compile(dialect=postgresql.dialect()))
+
+
 @pytest.mark.asyncio
 async def test_list_products_filter_by_category_id() -> None:
     """GET /products with category_id returns 200 and applies the filter."""
@@ -331,6 +346,68 @@ async def test_list_products_combined_filters_accepted() -> None:
     assert response.status_code == 200
 
 
+def test_product_cursor_round_trip_keeps_sort_value_type() -> None:
+    """A cursor decodes back to the typed sort value and id, even with commas in names."""
+    product = _make_product(name="Nuts, Bolts", price=Decimal("12.50"))
+
+    assert _decode_product_cursor(_encode_product_cursor(product, "name"), "name") == (
+        "Nuts, Bolts",
+        product.id,
+    )
+    assert _decode_product_cursor(_encode_product_cursor(product, "price"), "price") == (
+        Decimal("12.50"),
+        product.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_products_full_page_returns_next_cursor() -> None:
+    """A full page carries a next_cursor that points at its last product."""
+    p1 = _make_product(name="Alpha")
+    p2 = _make_product(name="Beta")
+    db_mock = _make_paginated_db_mock([p1, p2], total=5)
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/products?per_page=2&sort_by=name&sort_order=asc")
+
+    cursor = response.json()["pagination"]["next_cursor"]
+    assert _decode_product_cursor(cursor, "name") == ("Beta", p2.id)
+
+
+@pytest.mark.asyncio
+async def test_list_products_with_cursor_seeks_past_it() -> None:
+    """Passing cursor replaces the offset with a keyset condition."""
+    product = _make_product(name="Beta")
+    db_mock = _make_paginated_db_mock([])
+    cursor = _encode_product_cursor(product, "name")
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(f"/products?sort_by=name&sort_order=asc&cursor={cursor}")
+
+    assert response.status_code == 200
+    page_stmt = db_mock.execute.await_args_list[1].args[0]
+    sql = str(page_stmt.compile(dialect=postgresql.dialect()))
+    assert "(products.name, products.id) >" in sql
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["cursor=garbage", "sort_by=price&cursor={name_cursor}"])
+async def test_list_products_invalid_cursor_returns_400(query: str) -> None:
+    """Malformed cursors, and cursors issued for another sort_by, are rejected."""
+    name_cursor = _encode_product_cursor(_make_product(), "name")
+    db_mock = _make_paginated_db_mock([])
+
+    app = _make_app(db_mock)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(f"/products?{query.format(name_cursor=name_cursor)}")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
 # ---------------------------------------------------------------------------
 # POST /products — create
 # ---------------------------------------------------------------------------
@@ -345,24 +422,17 @@ async def test_create_product_authenticated_success() -> None:
     cat_mock = _make_category_mock()
     cat_mock.id = category_id
 
-    product_mock = _make_product(name="New Product", sku="NEW-001", category=cat_mock)
-    product_mock.category_id = category_id
-
-    async def fake_refresh(obj: Any) -> None:
+    def fake_insert(obj: Any) -> None:
+        # Values the INSERT ... RETURNING would populate on flush
         obj.id = uuid.uuid4()
         obj.created_at = datetime.now(UTC)
         obj.updated_at = datetime.now(UTC)
 
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.add = MagicMock()
+    db_mock.get = AsyncMock(side_effect=[user, cat_mock])
+    db_mock.add = MagicMock(side_effect=fake_insert)
     db_mock.flush = AsyncMock()
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock(side_effect=fake_refresh)
-    db_mock.execute = AsyncMock(return_value=reload_result)
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock):
         app = _make_app(db_mock)
@@ -395,24 +465,18 @@ async def test_create_product_admin_also_succeeds() -> None:
     category_id = uuid.uuid4()
     cat_mock = _make_category_mock()
     cat_mock.id = category_id
-    product_mock = _make_product(name="Admin Widget", sku="ADM-001", category=cat_mock)
-    product_mock.category_id = category_id
 
-    async def fake_refresh(obj: Any) -> None:
+    def fake_insert(obj: Any) -> None:
+        # Values the INSERT ... RETURNING would populate on flush
         obj.id = uuid.uuid4()
         obj.created_at = datetime.now(UTC)
         obj.updated_at = datetime.now(UTC)
 
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.add = MagicMock()
+    db_mock.get = AsyncMock(side_effect=[admin, cat_mock])
+    db_mock.add = MagicMock(side_effect=fake_insert)
     db_mock.flush = AsyncMock()
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock(side_effect=fake_refresh)
-    db_mock.execute = AsyncMock(return_value=reload_result)
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock):
         app = _make_app(db_mock)
@@ -630,6 +694,36 @@ async def test_create_product_invalid_category_id_returns_400() -> None:
     db_mock.rollback.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_create_product_unknown_category_returns_400_without_insert() -> None:
+    """POST /products checks the category up front and never inserts the product."""
+    user = _make_user()
+    token = _token(user)
+
+    db_mock = AsyncMock()
+    db_mock.get = AsyncMock(side_effect=[user, None])
+    db_mock.add = MagicMock()
+
+    with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
+        app = _make_app(db_mock)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post(
+                "/products",
+                json={
+                    "name": "Widget",
+                    "sku": "W-001",
+                    "price": "1.00",
+                    "category_id": str(uuid.uuid4()),
+                },
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+    assert response.status_code == 400
+    assert "category_id" in response.json()["detail"]
+    db_mock.add.assert_not_called()
+    mock_audit.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_create_product_writes_audit_log() -> None:
     """POST /products calls record_audit with action=create and resource_type=product."""
@@ -638,24 +732,18 @@ async def test_create_product_writes_audit_log() -> None:
     category_id = uuid.uuid4()
     cat_mock = _make_category_mock()
     cat_mock.id = category_id
-    product_mock = _make_product(category=cat_mock)
-    product_mock.category_id = category_id
 
-    async def fake_refresh(obj: Any) -> None:
+    def fake_insert(obj: Any) -> None:
+        # Values the INSERT ... RETURNING would populate on flush
         obj.id = uuid.uuid4()
         obj.created_at = datetime.now(UTC)
         obj.updated_at = datetime.now(UTC)
 
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.add = MagicMock()
+    db_mock.get = AsyncMock(side_effect=[user, cat_mock])
+    db_mock.add = MagicMock(side_effect=fake_insert)
     db_mock.flush = AsyncMock()
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock(side_effect=fake_refresh)
-    db_mock.execute = AsyncMock(return_value=reload_result)
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
@@ -686,24 +774,18 @@ async def test_create_product_audit_changes_include_all_fields() -> None:
     category_id = uuid.uuid4()
     cat_mock = _make_category_mock()
     cat_mock.id = category_id
-    product_mock = _make_product(category=cat_mock)
-    product_mock.category_id = category_id
 
-    async def fake_refresh(obj: Any) -> None:
+    def fake_insert(obj: Any) -> None:
+        # Values the INSERT ... RETURNING would populate on flush
         obj.id = uuid.uuid4()
         obj.created_at = datetime.now(UTC)
         obj.updated_at = datetime.now(UTC)
 
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.add = MagicMock()
+    db_mock.get = AsyncMock(side_effect=[user, cat_mock])
+    db_mock.add = MagicMock(side_effect=fake_insert)
     db_mock.flush = AsyncMock()
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock(side_effect=fake_refresh)
-    db_mock.execute = AsyncMock(return_value=reload_result)
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
@@ -739,14 +821,12 @@ async def test_get_product_returns_detail_with_stock_levels() -> None:
     stock_mock = _make_stock_level_mock(warehouse=warehouse_mock, quantity=100, min_threshold=10)
     product_mock = _make_product(name="Widget")
 
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = product_mock
-
     sl_result = MagicMock()
     sl_result.scalars.return_value.all.return_value = [stock_mock]
 
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(side_effect=[product_result, sl_result])
+    db_mock.get = AsyncMock(return_value=product_mock)
+    db_mock.execute = AsyncMock(return_value=sl_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -767,14 +847,12 @@ async def test_get_product_returns_empty_stock_levels_when_none() -> None:
     """GET /products/{id} returns empty stock_levels list when no stock exists."""
     product_mock = _make_product(name="Unstocked Widget")
 
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = product_mock
-
     sl_result = MagicMock()
     sl_result.scalars.return_value.all.return_value = []
 
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(side_effect=[product_result, sl_result])
+    db_mock.get = AsyncMock(return_value=product_mock)
+    db_mock.execute = AsyncMock(return_value=sl_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -790,14 +868,12 @@ async def test_get_product_includes_category_info() -> None:
     cat_mock = _make_category_mock(name="Electronics", description="Gadgets")
     product_mock = _make_product(name="Laptop", category=cat_mock)
 
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = product_mock
-
     sl_result = MagicMock()
     sl_result.scalars.return_value.all.return_value = []
 
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(side_effect=[product_result, sl_result])
+    db_mock.get = AsyncMock(return_value=product_mock)
+    db_mock.execute = AsyncMock(return_value=sl_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -818,14 +894,12 @@ async def test_get_product_multiple_stock_levels() -> None:
     sl2 = _make_stock_level_mock(warehouse=wh2, quantity=30)
     product_mock = _make_product(name="Distributed Widget")
 
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = product_mock
-
     sl_result = MagicMock()
     sl_result.scalars.return_value.all.return_value = [sl1, sl2]
 
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(side_effect=[product_result, sl_result])
+    db_mock.get = AsyncMock(return_value=product_mock)
+    db_mock.execute = AsyncMock(return_value=sl_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -838,11 +912,8 @@ async def test_get_product_multiple_stock_levels() -> None:
 @pytest.mark.asyncio
 async def test_get_product_not_found_returns_404() -> None:
     """GET /products/{id} with an unknown id returns 404."""
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(return_value=product_result)
+    db_mock.get = AsyncMock(return_value=None)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -868,14 +939,12 @@ async def test_get_product_no_auth_required() -> None:
     """GET /products/{id} is a public endpoint — no Authorization header needed."""
     product_mock = _make_product(name="Public Widget")
 
-    product_result = MagicMock()
-    product_result.scalar_one_or_none.return_value = product_mock
-
     sl_result = MagicMock()
     sl_result.scalars.return_value.all.return_value = []
 
     db_mock = AsyncMock()
-    db_mock.execute = AsyncMock(side_effect=[product_result, sl_result])
+    db_mock.get = AsyncMock(return_value=product_mock)
+    db_mock.execute = AsyncMock(return_value=sl_result)
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -897,17 +966,9 @@ async def test_update_product_authenticated_success() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Old Name", sku="OLD-001", category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock):
         app = _make_app(db_mock)
@@ -931,17 +992,9 @@ async def test_update_product_records_diff_in_audit() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Before", price=Decimal("10.00"), category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
@@ -966,15 +1019,8 @@ async def test_update_product_no_changes_skips_audit_and_commit() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Same Name", category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -999,15 +1045,8 @@ async def test_update_product_empty_body_skips_audit() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Unchanged", category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -1031,17 +1070,9 @@ async def test_update_product_writes_audit_log() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Before", category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
@@ -1067,17 +1098,9 @@ async def test_update_product_price_serialized_as_string_in_audit() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Widget", price=Decimal("10.00"), category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
@@ -1106,19 +1129,14 @@ async def test_update_product_category_id_serialized_as_string_in_audit() -> Non
     product_mock = _make_product(name="Widget", category=cat_mock)
     product_mock.category_id = old_category_id
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
-    reload_result = MagicMock()
-    reload_result.scalar_one.return_value = product_mock
+    new_category_id = uuid.uuid4()
+    new_cat_mock = _make_category_mock(name="Tools")
+    new_cat_mock.id = new_category_id
 
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(side_effect=[fetch_result, reload_result])
+    db_mock.get = AsyncMock(side_effect=[user, product_mock, new_cat_mock])
     db_mock.commit = AsyncMock()
-    db_mock.refresh = AsyncMock()
 
-    new_category_id = uuid.uuid4()
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
         app = _make_app(db_mock)
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -1152,12 +1170,8 @@ async def test_update_product_not_found_returns_404() -> None:
     user = _make_user()
     token = _token(user)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[user, None])
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -1179,12 +1193,8 @@ async def test_update_product_invalid_category_id_returns_400() -> None:
     cat_mock = _make_category_mock()
     product_mock = _make_product(name="Widget", category=cat_mock)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=user)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[user, product_mock])
     db_mock.commit = AsyncMock(side_effect=IntegrityError("FK violation", {}, Exception()))
     db_mock.rollback = AsyncMock()
 
@@ -1213,12 +1223,8 @@ async def test_delete_product_admin_success() -> None:
     token = _token(admin)
     product_mock = _make_product(name="To Be Deleted", is_active=True)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[admin, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -1244,12 +1250,8 @@ async def test_delete_product_sets_is_active_false() -> None:
     token = _token(admin)
     product_mock = _make_product(name="Active Product", is_active=True)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[admin, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock):
@@ -1273,12 +1275,8 @@ async def test_delete_product_writes_audit_log() -> None:
     token = _token(admin)
     product_mock = _make_product(name="Audited Product")
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[admin, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -1303,12 +1301,8 @@ async def test_delete_product_audit_includes_name_and_sku() -> None:
     token = _token(admin)
     product_mock = _make_product(name="Delete Me", sku="DEL-001")
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = product_mock
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[admin, product_mock])
     db_mock.commit = AsyncMock()
 
     with patch("src.api.products.record_audit", new_callable=AsyncMock) as mock_audit:
@@ -1360,12 +1354,8 @@ async def test_delete_product_not_found_returns_404() -> None:
     admin = _make_user(role="admin")
     token = _token(admin)
 
-    fetch_result = MagicMock()
-    fetch_result.scalar_one_or_none.return_value = None
-
     db_mock = AsyncMock()
-    db_mock.get = AsyncMock(return_value=admin)
-    db_mock.execute = AsyncMock(return_value=fetch_result)
+    db_mock.get = AsyncMock(side_effect=[admin, None])
 
     app = _make_app(db_mock)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -4,11 +4,13 @@ Covers:
 - ``get_user_key``: key extraction from Bearer JWT, X-API-Key header, and IP fallback
 - ``rate_limit_exceeded_handler``: 429 envelope format and header injection
 - ``limiter``: rate limit enforcement via ``@limiter.limit()`` decorator
+- ``ShortCircuitLimiter``: cached rejections that skip the storage backend
 - Rate-limit response headers (X-RateLimit-*, Retry-After) on normal and 429 responses
 """
 
 import uuid
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI, Request, Response
@@ -20,6 +22,7 @@ from slowapi.errors import RateLimitExceeded
 
 from src.config import settings
 from src.middleware.rate_limit import (
+    ShortCircuitLimiter,
     get_remote_address,
     get_user_key,
     limiter,
@@ -324,6 +327,51 @@ class TestRateLimitEnforcement:
         assert r2.status_code == 200
 
 
+# ---------------------------------------------------------------------------
+# ShortCircuitLimiter — locally cached rejections
+# ---------------------------------------------------------------------------
+
+
+def _make_short_circuit_app() -> tuple[FastAPI, ShortCircuitLimiter]:
+    """Return an app limited to 1/minute by a fresh ShortCircuitLimiter."""
+    test_limiter = ShortCircuitLimiter(key_func=get_remote_address, headers_enabled=True)
+    app = FastAPI()
+    app.state.limiter = test_limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)  # type: ignore[arg-type]
+
+    @app.get("/limited")
+    @test_limiter.limit("1/minute")
+    async def limited(request: Request, response: Response) -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app, test_limiter
+
+
+class TestShortCircuitLimiter:
+    def test_exhausted_caller_is_rejected_without_storage_hit(self) -> None:
+        app, test_limiter = _make_short_circuit_app()
+        client = TestClient(app, raise_server_exceptions=False)
+        client.get("/limited")
+        assert client.get("/limited").status_code == 429
+
+        with patch.object(test_limiter.limiter, "hit") as mock_hit:
+            response = client.get("/limited")
+
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 0
+        mock_hit.assert_not_called()
+
+    def test_reset_forgets_cached_blocks(self) -> None:
+        app, test_limiter = _make_short_circuit_app()
+        client = TestClient(app, raise_server_exceptions=False)
+        client.get("/limited")
+        assert client.get("/limited").status_code == 429
+
+        test_limiter.reset()
+
+        assert client.get("/limited").status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # limiter export
 # ---------------------------------------------------------------------------
@@ -338,6 +386,11 @@ class TestLimiterExport:
 
         assert isinstance(limiter._storage, MemoryStorage)
 
+    def test_limiter_uses_moving_window(self) -> None:
+        from limits.strategies import MovingWindowRateLimiter
+
+        assert isinstance(limiter._limiter, MovingWindowRateLimiter)
+
     def test_limiter_has_headers_enabled(self) -> None:
         assert limiter._headers_enabled is True
 
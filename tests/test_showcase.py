@@ -2,17 +2,26 @@
 
 Coverage
 --------
-* Landing page: HTTP 200, HTML content-type, required content markers (branding,
-  tech stack, build history, demo credentials, navigation links).
+* Landing page: HTTP 200, HTML content-type, cache headers, gzip negotiation,
+  content-hashed CSS/JS assets, required content markers (branding, tech
+  stack, build history, demo credentials, navigation links).
 * Showcase stats: HTTP 200, no auth required, JSON schema, non-negative values,
-  live counts that reflect seeded test data.
+  live counts that reflect seeded test data (also rendered into the landing
+  page), results reused within the TTL.
+* Conditional requests: weak ETag and Cache-Control headers, 304 on a matching
+  If-None-Match.
 * Existing /api/v1/* routes are unaffected by the addition of the landing page
   and stats endpoint (smoke tests).
 """
 
+import json
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from httpx import AsyncClient
 
+from src.api import showcase
+
 # ---------------------------------------------------------------------------
 # Landing page — HTTP response basics
 # ---------------------------------------------------------------------------
@@ -32,6 +41,52 @@ async def test_landing_page_content_type_html(async_client: AsyncClient) -> None
     assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.asyncio
+async def test_landing_page_cacheable(async_client: AsyncClient) -> None:
+    """Root URL is served with an exact Content-Length, Cache-Control and preconnect hints."""
+    response = await async_client.get("/", headers={"Accept-Encoding": "identity"})
+    assert response.headers["content-length"] == str(len(response.content))
+    assert response.headers["cache-control"] == "public, max-age=30"
+    assert "<https://cdn.tailwindcss.com>; rel=preconnect" in response.headers["link"]
+
+
+@pytest.mark.asyncio
+async def test_landing_page_gzip_negotiation(async_client: AsyncClient) -> None:
+    """The precompressed body is sent only to clients that accept gzip."""
+    gzipped = await async_client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert "ShipAPI" in gzipped.text
+
+    plain = await async_client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == gzipped.text
+
+
+@pytest.mark.asyncio
+async def test_landing_page_assets_versioned(async_client: AsyncClient) -> None:
+    """CSS/JS are linked under content-hashed names served with an immutable cache."""
+    html = (await async_client.get("/")).text
+    for url in showcase._ASSET_URLS.values():
+        assert f'"{url}"' in html
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    response = await async_client.get("/static/landing.0000.css")
+    assert response.status_code == 404
+
+
+def test_accepts_gzip_honours_q_values() -> None:
+    """``q=0`` refuses an encoding; wildcards and positive weights accept it."""
+    assert showcase._accepts_gzip("gzip")
+    assert showcase._accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert showcase._accepts_gzip("*")
+    assert not showcase._accepts_gzip("gzip;q=0")
+    assert not showcase._accepts_gzip("br, identity")
+    assert not showcase._accepts_gzip("")
+
+
 # ---------------------------------------------------------------------------
 # Landing page — branding content markers
 # ---------------------------------------------------------------------------
@@ -241,6 +296,36 @@ async def test_stats_reflects_seeded_data(async_client: AsyncClient, seeded_db:
     assert body["stock_alerts"] == 1
 
 
+@pytest.mark.asyncio
+async def test_landing_page_renders_seeded_stats(
+    async_client: AsyncClient,
+    seeded_db: dict,  # noqa: ARG001
+) -> None:
+    """The landing page carries the live counts in its HTML, not a placeholder."""
+    html = (await async_client.get("/")).text
+    assert '<div class="text-3xl font-bold text-blue-400" id="stat-products">3</div>' in html
+    assert 'id="stat-categories">2<' in html
+    assert 'id="stat-alerts">1<' in html
+
+
+@pytest.mark.asyncio
+async def test_landing_page_survives_database_outage(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With no stats available, / still renders — with placeholders for the counts."""
+    session_factory = MagicMock(side_effect=OSError("connection refused"))
+    monkeypatch.setattr(showcase, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(showcase, "_landing_cache", None)
+
+    response = await async_client.get("/")
+
+    assert response.status_code == 200
+    assert 'id="stat-products">—<' in response.text
+    assert 'id="stat-alerts">—<' in response.text
+    assert showcase._landing_cache is None
+    session_factory.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_stats_empty_database_returns_zeros(async_client: AsyncClient) -> None:
     """Stats returns zero counts when no data has been seeded (clean test DB)."""
@@ -254,6 +339,68 @@ async def test_stats_empty_database_returns_zeros(async_client: AsyncClient) ->
         )
 
 
+@pytest.mark.asyncio
+async def test_stats_cached_within_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second call inside the TTL returns the cached stats without querying."""
+    counts = [
+        ("products", 1),
+        ("categories", 2),
+        ("warehouses", 3),
+        ("stock_alerts", 4),
+        ("stock_transfers", 5),
+        ("audit_log_entries", 6),
+    ]
+    db = AsyncMock()
+    db.execute.return_value.tuples = MagicMock(
+        return_value=MagicMock(all=MagicMock(return_value=counts))
+    )
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = db
+    monkeypatch.setattr(showcase, "AsyncSessionLocal", session_factory)
+
+    first = await showcase._load_stats()
+    second = await showcase._load_stats()
+
+    assert second == first
+    assert json.loads(first[0])["audit_log_entries"] == 6
+    db.execute.assert_awaited_once()
+    session_factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stats_sends_etag_and_cache_control(async_client: AsyncClient) -> None:
+    """Stats responses carry a weak ETag and a public Cache-Control header."""
+    response = await async_client.get("/api/v1/showcase/stats")
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "public, max-age=30"
+
+
+@pytest.mark.asyncio
+async def test_stats_if_none_match_returns_304(async_client: AsyncClient) -> None:
+    """A matching If-None-Match gets 304 with no body; a stale one gets the stats."""
+    etag = (await async_client.get("/api/v1/showcase/stats")).headers["etag"]
+
+    response = await async_client.get("/api/v1/showcase/stats", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await async_client.get(
+        "/api/v1/showcase/stats", headers={"If-None-Match": 'W/"stale"'}
+    )
+    assert response.status_code == 200
+    assert "products" in response.json()
+
+
+def test_etag_matches_weak_comparison() -> None:
+    """Lists, strong/weak variants and ``*`` all match per RFC 9110."""
+    assert showcase._etag_matches('"a", W/"abc"', 'W/"abc"')
+    assert showcase._etag_matches('"abc"', 'W/"abc"')
+    assert showcase._etag_matches("*", 'W/"abc"')
+    assert not showcase._etag_matches('W/"abd"', 'W/"abc"')
+    assert not showcase._etag_matches(None, 'W/"abc"')
+
+
 # ---------------------------------------------------------------------------
 # Existing /api/v1/* routes — smoke tests (must not be affected by landing page)
 # ---------------------------------------------------------------------------